@@ -14,13 +14,15 @@ ALPACA_CONFIG = {
     'api_key' : 'xxx',
     'client_id' : 'xxx',
     'api_secret': 'xxx',
-    'redirect_uri': 'https://paper-api.alpaca.markets/v2'
+    'redirect_uri': 'https://paper-api.alpaca.markets/v2',
+    'data_url': None  # override the market data endpoint, e.g. a local stub server
 }
 
 # Binance Api Configuration
 BINANCE_CONFIG = {
     'api_key' : 'xxx',
-    'api_secret' : 'xxx'
+    'api_secret' : 'xxx',
+    'api_url': None  # override the REST endpoint, e.g. a local stub server
 }
 
 
@@ -31,6 +33,12 @@ SYMBOLS = {
     'finnhub': ['AAPL', 'MSFT']
 }
 
+# Provider rate limits used by the request scheduler
+RATE_LIMITS = {
+    'alpaca': {'requests_per_minute': 200, 'max_symbols_per_request': 100},
+    'binance': {'requests_per_minute': 300, 'max_symbols_per_request': 100}  # all-ticker call weighs 4 of 1200/min
+}
+
 INTERVALS = {
     '1min': '1min',
     '5min': '5min', 
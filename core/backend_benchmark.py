@@ -0,0 +1,122 @@
+import time
+import numpy as np
+from core.backends import BACKENDS, create_backend
+from core.black_scholes import BlackScholes
+from core.greeks_calculator import GreeksCalculator
+
+OUTPUTS = ['price', 'delta', 'gamma', 'theta', 'vega', 'rho']
+
+# Documented error bounds against the float64 NumPy reference, as
+# |value - reference| <= atol + rtol * |reference| over make_scenarios().
+# float32 is limited by single precision (~1.2e-7 relative per operation,
+# amplified by the S - K e^-rT cancellation for deep in-the-money options);
+# the measured maximum error is below 4e-5.
+# The Numba kernels use erfc instead of SciPy's ndtr, which agree to within
+# a few ulps in float64.
+ACCURACY_BOUNDS = {
+    'numpy': {'rtol': 0.0, 'atol': 0.0},
+    'float32': {'rtol': 1e-4, 'atol': 1e-4},
+    'numba': {'rtol': 1e-9, 'atol': 1e-9},
+    'numba32': {'rtol': 1e-4, 'atol': 1e-4},
+}
+
+def make_scenarios(n, seed=0):
+    """Random contracts around a 100 underlying, including some expired and zero-volatility ones"""
+    rng = np.random.default_rng(seed)
+    S = np.full(n, 100.0)
+    K = rng.uniform(50, 150, n)
+    T = rng.uniform(-0.01, 2.0, n)
+    r = rng.uniform(0.0, 0.1, n)
+    sigma = np.where(rng.random(n) < 0.01, 0.0, rng.uniform(0.05, 1.0, n))
+    is_call = rng.random(n) < 0.5
+    return S, K, T, r, sigma, is_call
+
+def evaluate(backend, scenarios):
+    results = backend.greeks(*scenarios)
+    results['price'] = backend.prices(*scenarios)
+    return results
+
+def check_reference(n=1000, seed=0):
+    """Max deviation of the float64 NumPy backend from the scalar formulas"""
+    S, K, T, r, sigma, is_call = make_scenarios(n, seed)
+    live = (T > 0) & (sigma > 0)  # the scalar formulas divide by sigma
+    S, K, T, r, sigma, is_call = S[live], K[live], T[live], r[live], sigma[live], is_call[live]
+    vectorized = evaluate(create_backend('numpy'), (S, K, T, r, sigma, is_call))
+
+    errors = dict.fromkeys(OUTPUTS, 0.0)
+    for i in range(len(S)):
+        option_type = 'call' if is_call[i] else 'put'
+        price = (BlackScholes.calculate_call_price if is_call[i] else BlackScholes.calculate_put_price)(
+            S[i], K[i], T[i], r[i], sigma[i])
+        scalar = GreeksCalculator.calculate_all_greeks(S[i], K[i], T[i], r[i], sigma[i], option_type)
+        scalar['price'] = price
+        for name in OUTPUTS:
+            errors[name] = max(errors[name], abs(float(vectorized[name][i]) - float(scalar[name])))
+    return errors
+
+def check_accuracy(n=1_000_000, seed=0, names=None):
+    """Compare backends (default: all) with the float64 reference.
+
+    Returns {backend: {output: (max_abs_error, within_bounds)}}; backends
+    whose optional dependencies are missing are skipped.
+    """
+    scenarios = make_scenarios(n, seed)
+    reference = evaluate(create_backend('numpy'), scenarios)
+    report = {}
+    for name in names or BACKENDS:
+        try:
+            results = evaluate(create_backend(name), scenarios)
+        except ImportError:
+            continue
+        bounds = ACCURACY_BOUNDS[name]
+        report[name] = {}
+        for output in OUTPUTS:
+            ref = reference[output]
+            error = np.abs(results[output].astype(np.float64) - ref)
+            within = bool(np.all(error <= bounds['atol'] + bounds['rtol'] * np.abs(ref)))
+            report[name][output] = (float(error.max()), within)
+    return report
+
+def benchmark(sizes=(1_000, 100_000, 2_000_000), repeats=3, seed=0):
+    """Best-of-`repeats` wall time (seconds) for prices + Greeks per backend and size"""
+    timings = {}
+    for name in BACKENDS:
+        try:
+            backend = create_backend(name)
+            evaluate(backend, make_scenarios(10, seed))  # compile / warm up
+        except ImportError:
+            continue
+        timings[name] = {}
+        for size in sizes:
+            scenarios = make_scenarios(size, seed)
+            best = float('inf')
+            for _ in range(repeats):
+                start = time.perf_counter()
+                evaluate(backend, scenarios)
+                best = min(best, time.perf_counter() - start)
+            timings[name][size] = best
+    return timings
+
+def report(n=1_000_000, sizes=(1_000, 100_000, 2_000_000)):
+    """Print the accuracy check and benchmark tables"""
+    print("Scalar formulas vs numpy backend (max abs error):")
+    for output, error in check_reference().items():
+        print(f"  {output:6s} {error:.2e}")
+
+    print(f"\nAccuracy vs float64 reference over {n:,} contracts (max abs error):")
+    all_within = True
+    for name, outputs in check_accuracy(n).items():
+        cells = []
+        for output, (error, within) in outputs.items():
+            cells.append(f"{output} {error:.1e}{'' if within else ' !'}")
+            all_within &= within
+        print(f"  {name:8s} " + ", ".join(cells))
+    if not all_within:
+        print("  ! marks outputs outside ACCURACY_BOUNDS")
+
+    print("\nPrices + Greeks throughput (million contracts/s):")
+    timings = benchmark(sizes)
+    print("  " + "backend".ljust(9) + "".join(f"{size:>14,}" for size in sizes))
+    for name, by_size in timings.items():
+        print("  " + name.ljust(9) + "".join(f"{size / seconds / 1e6:>14.1f}" for size, seconds in by_size.items()))
+    return all_within
@@ -0,0 +1,203 @@
+import math
+import os
+import numpy as np
+from utils.math_utils import calculate_d1_d2_vectorized, normal_cdf_fast, normal_pdf_fast
+
+class NumpyBackend:
+    """Vectorized NumPy/SciPy pricing at a fixed floating-point precision.
+
+    float64 is the reference implementation. float32 halves memory and
+    bandwidth for large scenario grids at roughly single-precision accuracy.
+    """
+
+    def __init__(self, name, dtype):
+        self.name = name
+        self.dtype = np.dtype(dtype)
+
+    def _inputs(self, S, K, T, r, sigma, is_call):
+        return np.broadcast_arrays(
+            *(np.asarray(x, dtype=self.dtype) for x in (S, K, T, r, sigma)),
+            np.asarray(is_call, dtype=bool)
+        )
+
+    def prices(self, S, K, T, r, sigma, is_call):
+        """European option prices; expired contracts at intrinsic value"""
+        S, K, T, r, sigma, is_call = self._inputs(S, K, T, r, sigma, is_call)
+        d1, d2 = calculate_d1_d2_vectorized(S, K, T, r, sigma, self.dtype)
+        discounted_K = K * np.exp(-r * np.maximum(T, 0))
+
+        call = S * normal_cdf_fast(d1) - discounted_K * normal_cdf_fast(d2)
+        put = discounted_K * normal_cdf_fast(-d2) - S * normal_cdf_fast(-d1)
+        price = np.where(is_call, call, put)
+
+        intrinsic = np.where(is_call, np.maximum(S - K, 0), np.maximum(K - S, 0))
+        return np.where(T > 0, price, intrinsic)
+
+    def greeks(self, S, K, T, r, sigma, is_call):
+        """Delta, gamma, daily theta, vega and rho per 1% move"""
+        S, K, T, r, sigma, is_call = self._inputs(S, K, T, r, sigma, is_call)
+        d1, d2 = calculate_d1_d2_vectorized(S, K, T, r, sigma, self.dtype)
+        live = T > 0
+        T_live = np.where(live, T, self.dtype.type(1))
+        sqrt_T = np.sqrt(T_live)
+        pdf_d1 = normal_pdf_fast(d1)
+        discounted_K = K * np.exp(-r * T_live)
+        cdf_d1 = normal_cdf_fast(d1)
+        cdf_d2 = np.where(is_call, normal_cdf_fast(d2), normal_cdf_fast(-d2))
+        sign = np.where(is_call, self.dtype.type(1), self.dtype.type(-1))
+
+        delta = np.where(is_call, cdf_d1, cdf_d1 - 1)
+        expired_delta = np.where(is_call, (S > K).astype(self.dtype), -(S < K).astype(self.dtype))
+
+        greeks = {}
+        greeks['delta'] = np.where(live, delta, expired_delta)
+        # pdf_d1 is 0 at zero volatility, so any non-zero denominator gives gamma 0
+        vol_sqrt_T = sigma * sqrt_T
+        greeks['gamma'] = np.where(live, pdf_d1 / (S * np.where(vol_sqrt_T > 0, vol_sqrt_T, 1)), 0)
+
+        # Theta (daily)
+        theta = -(S * pdf_d1 * sigma) / (2 * sqrt_T) - sign * r * discounted_K * cdf_d2
+        greeks['theta'] = np.where(live, theta / 365, 0)
+
+        # Vega (for 1% vol change)
+        greeks['vega'] = np.where(live, S * pdf_d1 * sqrt_T / 100, 0)
+
+        # Rho (for 1% rate change)
+        greeks['rho'] = np.where(live, sign * T_live * discounted_K * cdf_d2 / 100, 0)
+
+        return greeks
+
+def _build_numba_kernels():
+    """Compile the fused Numba kernels (only called when numba is available)"""
+    import numba
+
+    @numba.njit(inline='always')
+    def cdf(x):
+        return 0.5 * math.erfc(-x / math.sqrt(2.0))
+
+    @numba.njit(inline='always')
+    def pdf(x):
+        return math.exp(-0.5 * x * x) / math.sqrt(2.0 * math.pi)
+
+    @numba.njit(inline='always')
+    def d1_or_inf(drift, vol_sqrt_T):
+        # Zero volatility: +/-inf as in calculate_d1_d2_vectorized
+        if vol_sqrt_T > 0:
+            return drift / vol_sqrt_T
+        return math.inf if drift > 0 else -math.inf
+
+    @numba.vectorize(['float64(float64, float64, float64, float64, float64, boolean)',
+                      'float32(float32, float32, float32, float32, float32, boolean)'],
+                     target='parallel')
+    def price_kernel(S, K, T, r, sigma, is_call):
+        if T <= 0:
+            return max(S - K, 0.0) if is_call else max(K - S, 0.0)
+        vol_sqrt_T = sigma * math.sqrt(T)
+        d1 = d1_or_inf(math.log(S / K) + (r + 0.5 * sigma * sigma) * T, vol_sqrt_T)
+        d2 = d1 - vol_sqrt_T
+        discounted_K = K * math.exp(-r * T)
+        if is_call:
+            return S * cdf(d1) - discounted_K * cdf(d2)
+        return discounted_K * cdf(-d2) - S * cdf(-d1)
+
+    @numba.njit(parallel=True)
+    def greeks_kernel(S, K, T, r, sigma, is_call, delta, gamma, theta, vega, rho):
+        for i in numba.prange(S.shape[0]):
+            if T[i] <= 0:
+                if is_call[i]:
+                    delta[i] = 1.0 if S[i] > K[i] else 0.0
+                else:
+                    delta[i] = -1.0 if S[i] < K[i] else 0.0
+                gamma[i] = 0.0
+                theta[i] = 0.0
+                vega[i] = 0.0
+                rho[i] = 0.0
+                continue
+            sqrt_T = math.sqrt(T[i])
+            vol_sqrt_T = sigma[i] * sqrt_T
+            d1 = d1_or_inf(math.log(S[i] / K[i]) + (r[i] + 0.5 * sigma[i] * sigma[i]) * T[i], vol_sqrt_T)
+            d2 = d1 - vol_sqrt_T
+            pdf_d1 = pdf(d1)
+            discount = math.exp(-r[i] * T[i])
+            if is_call[i]:
+                sign, cdf_d2 = 1.0, cdf(d2)
+                delta[i] = cdf(d1)
+            else:
+                sign, cdf_d2 = -1.0, cdf(-d2)
+                delta[i] = cdf(d1) - 1.0
+            gamma[i] = pdf_d1 / (S[i] * vol_sqrt_T) if vol_sqrt_T > 0 else 0.0
+            theta[i] = (-(S[i] * pdf_d1 * sigma[i]) / (2.0 * sqrt_T)
+                        - sign * r[i] * K[i] * discount * cdf_d2) / 365.0
+            vega[i] = S[i] * pdf_d1 * sqrt_T / 100.0
+            rho[i] = sign * K[i] * T[i] * discount * cdf_d2 / 100.0
+
+    return price_kernel, greeks_kernel
+
+class NumbaBackend(NumpyBackend):
+    """Numba-compiled fused kernels running multithreaded across cores.
+
+    Each contract is priced in a single pass without NumPy temporaries.
+    Kernels are compiled on first use.
+    """
+
+    _kernels = None
+
+    def __init__(self, name='numba', dtype=np.float64):
+        import numba  # noqa: F401 - fail at selection time if numba is missing
+        super().__init__(name, dtype)
+
+    @classmethod
+    def kernels(cls):
+        if cls._kernels is None:
+            cls._kernels = _build_numba_kernels()
+        return cls._kernels
+
+    def _flat_inputs(self, S, K, T, r, sigma, is_call):
+        arrays = self._inputs(S, K, T, r, sigma, is_call)
+        shape = arrays[0].shape
+        return shape, [np.ascontiguousarray(x).ravel() for x in arrays]
+
+    def prices(self, S, K, T, r, sigma, is_call):
+        price_kernel, _ = self.kernels()
+        shape, arrays = self._flat_inputs(S, K, T, r, sigma, is_call)
+        return price_kernel(*arrays).reshape(shape)
+
+    def greeks(self, S, K, T, r, sigma, is_call):
+        _, greeks_kernel = self.kernels()
+        shape, arrays = self._flat_inputs(S, K, T, r, sigma, is_call)
+        outputs = {name: np.empty(len(arrays[0]), dtype=self.dtype)
+                   for name in ['delta', 'gamma', 'theta', 'vega', 'rho']}
+        greeks_kernel(*arrays, *outputs.values())
+        return {name: values.reshape(shape) for name, values in outputs.items()}
+
+BACKENDS = {
+    'numpy': lambda: NumpyBackend('numpy', np.float64),
+    'float32': lambda: NumpyBackend('float32', np.float32),
+    'numba': lambda: NumbaBackend('numba', np.float64),
+    'numba32': lambda: NumbaBackend('numba32', np.float32),
+}
+
+_active_backend = None
+
+def create_backend(name):
+    """Instantiate a backend by name"""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend {name!r}, choose from {sorted(BACKENDS)}")
+    try:
+        return BACKENDS[name]()
+    except ImportError as e:
+        raise ImportError(f"Backend {name!r} requires numba: pip install numba") from e
+
+def set_backend(name):
+    """Select the compute backend used by the vectorized pricing functions"""
+    global _active_backend
+    _active_backend = create_backend(name)
+    return _active_backend
+
+def get_backend(name=None):
+    """Return the named backend, or the active one (BS_BACKEND env var, default numpy)"""
+    if name is not None:
+        return create_backend(name)
+    if _active_backend is None:
+        set_backend(os.environ.get('BS_BACKEND', 'numpy'))
+    return _active_backend
@@ -0,0 +1,171 @@
+import multiprocessing
+import os
+import time
+from datetime import datetime, timezone
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from core.backends import get_backend
+from core.black_scholes import BlackScholes
+from core.greeks_calculator import GreeksCalculator
+from utils.trading_calendar import get_default_calendar
+
+CONTRACT_COLUMNS = ['S', 'K', 'T', 'r', 'sigma', 'type']
+EXPIRY_COLUMN = 'expiry'
+DATE_ONLY_PATTERN = r'\d{4}-\d{2}-\d{2}'
+RESULT_COLUMNS = ['price', 'delta', 'gamma', 'theta', 'vega', 'rho']
+
+# Fixed input dtypes so every chunk produces the same Parquet schema
+CONTRACT_DTYPES = {
+    'S': 'float64', 'K': 'float64', 'T': 'float64', 'r': 'float64', 'sigma': 'float64',
+    'type': 'string'
+}
+
+def expiry_year_fractions(expiries, valuation_time=None, trading_time=False):
+    """Time to expiry in years for a column of expiry timestamps.
+
+    Expiries are ISO 8601 strings (or dates/timestamps from Parquet). Naive
+    times are exchange-local, and date-only values (`YYYY-MM-DD` or date
+    objects) expire at that day's close. Both are decided per row, so a
+    row's T does not depend on the rest of its chunk. Missing expiries raise
+    ValueError naming the offending rows.
+    """
+    missing = expiries.isna()
+    if missing.any():
+        rows = list(expiries.index[missing][:10])
+        raise ValueError(f"Missing expiry in {int(missing.sum())} row(s), first at {rows}")
+
+    if pd.api.types.is_datetime64_any_dtype(expiries):
+        values = expiries
+        date_only = np.zeros(len(expiries), dtype=bool)
+    else:
+        text = expiries.astype('string').str.strip()
+        date_only = text.str.fullmatch(DATE_ONLY_PATTERN).to_numpy(dtype=bool)
+        values = pd.to_datetime(text, format='ISO8601')
+
+    calendar = get_default_calendar()
+    fraction = calendar.trading_year_fraction if trading_time else calendar.year_fraction
+    T = np.empty(len(values), dtype=np.float64)
+    if date_only.any():
+        T[date_only] = fraction(values[date_only].to_numpy().astype('datetime64[D]'), valuation_time)
+    if not date_only.all():
+        timed = values[~date_only]
+        T[~date_only] = fraction(timed if timed.dt.tz is not None else timed.to_numpy(), valuation_time)
+    return T
+
+def price_contracts(chunk, valuation_time=None, trading_time=False, backend=None):
+    """Price a DataFrame of contracts and append price and Greeks columns.
+
+    Contracts without a T column get it from their expiry column, measured
+    against valuation_time (calendar or trading time). `backend` names the
+    compute backend (default: the active one).
+    """
+    chunk = chunk.astype({name: CONTRACT_DTYPES[name] for name in chunk.columns if name in CONTRACT_DTYPES})
+    S = chunk['S'].to_numpy(dtype=np.float64)
+    K = chunk['K'].to_numpy(dtype=np.float64)
+    if 'T' in chunk:
+        T = chunk['T'].to_numpy(dtype=np.float64)
+    else:
+        T = expiry_year_fractions(chunk[EXPIRY_COLUMN], valuation_time, trading_time)
+    r = chunk['r'].to_numpy(dtype=np.float64)
+    sigma = chunk['sigma'].to_numpy(dtype=np.float64)
+    is_call = chunk['type'].astype(str).str.strip().str.lower().str.startswith('c').to_numpy()
+
+    result = chunk.copy()
+    result['T'] = T
+    result['price'] = BlackScholes.calculate_prices(S, K, T, r, sigma, is_call, backend)
+    greeks = GreeksCalculator.calculate_all_greeks_vectorized(S, K, T, r, sigma, is_call, backend)
+    for name in RESULT_COLUMNS[1:]:
+        result[name] = greeks[name]
+    return result
+
+class BatchPricer:
+    """Price large contract files chunk by chunk across a process pool.
+
+    Input is read in fixed-size chunks from CSV or Parquet, and at most
+    `max_pending` chunks are in flight at once, so memory use depends on the
+    chunk size and worker count rather than on the size of the input file.
+    Results are appended to the output Parquet file in input order.
+
+    Inputs may give an expiry column instead of T; every chunk is then
+    valued against the same valuation_time (default: when the run starts).
+
+    Workers are spawned rather than forked, since forking a parent that
+    already runs threads (e.g. Numba's parallel backend) can deadlock them.
+    They price on `backend`, by default the backend active in this process.
+    """
+
+    def __init__(self, chunk_size=250_000, workers=None, max_pending=None,
+                 valuation_time=None, trading_time=False, backend=None):
+        self.chunk_size = chunk_size
+        self.backend = backend
+        self.valuation_time = valuation_time
+        self.trading_time = trading_time
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 2 * self.workers
+
+    def iter_chunks(self, input_path):
+        """Yield DataFrames of at most chunk_size contracts from CSV or Parquet"""
+        wanted = CONTRACT_COLUMNS + [EXPIRY_COLUMN]
+        if input_path.lower().endswith(('.parquet', '.pq')):
+            parquet_file = pq.ParquetFile(input_path)
+            columns = [name for name in parquet_file.schema_arrow.names if name in wanted]
+            for batch in parquet_file.iter_batches(batch_size=self.chunk_size, columns=columns):
+                yield batch.to_pandas()
+        else:
+            yield from pd.read_csv(input_path, usecols=lambda name: name in wanted,
+                                   dtype={**CONTRACT_DTYPES, EXPIRY_COLUMN: 'string'},
+                                   chunksize=self.chunk_size)
+
+    def run(self, input_path, output_path):
+        """Price every contract in input_path and write results to output_path.
+
+        Results go to a temporary file that replaces output_path only once
+        every chunk has been written, so a failed run leaves any existing
+        output untouched.
+        """
+        start = time.perf_counter()
+        valuation_time = self.valuation_time or datetime.now(timezone.utc)
+        backend = self.backend or get_backend().name
+        temp_path = f"{output_path}.tmp"
+        rows = 0
+        writer = None
+        pending = deque()
+
+        def write_result(result):
+            nonlocal writer, rows
+            table = pa.Table.from_pandas(result, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(temp_path, table.schema)
+            writer.write_table(table)
+            rows += len(result)
+
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                for chunk in self.iter_chunks(input_path):
+                    pending.append(executor.submit(price_contracts, chunk, valuation_time,
+                                                   self.trading_time, backend))
+                    if len(pending) >= self.max_pending:
+                        write_result(pending.popleft().result())
+
+                while pending:
+                    write_result(pending.popleft().result())
+        except BaseException:
+            # Drop this run's partial output; output_path is never touched
+            if writer is not None:
+                writer.close()
+                os.remove(temp_path)
+            raise
+
+        if writer is not None:
+            writer.close()
+            os.replace(temp_path, output_path)
+
+        elapsed = time.perf_counter() - start
+        print(f"Priced {rows:,} contracts in {elapsed:.2f}s "
+              f"({rows / elapsed if elapsed > 0 else 0:,.0f} contracts/s) -> {output_path}")
+        return rows
@@ -1,5 +1,6 @@
 import numpy as np
 from utils.math_utils import calculate_d1_d2, normal_cdf
+from core.backends import get_backend
 
 class BlackScholes:
     @staticmethod
@@ -18,4 +19,14 @@ class BlackScholes:
             return max(K - S, 0)
         
         d1, d2 = calculate_d1_d2(S, K, T, r, sigma)
-        return K * np.exp(-r * T) * normal_cdf(-d2) - S * normal_cdf(-d1)
\ No newline at end of file
+        return K * np.exp(-r * T) * normal_cdf(-d2) - S * normal_cdf(-d1)
+    
+    @staticmethod
+    def calculate_prices(S, K, T, r, sigma, is_call, backend=None):
+        """Calculate European option prices for arrays of contracts.
+
+        `is_call` is a boolean array selecting call (True) or put (False)
+        pricing per contract. Expired contracts are priced at intrinsic value.
+        Runs on the active compute backend unless `backend` names another.
+        """
+        return get_backend(backend).prices(S, K, T, r, sigma, is_call)
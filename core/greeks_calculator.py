@@ -1,4 +1,5 @@
 from utils.math_utils import calculate_d1_d2, normal_cdf
+from core.backends import get_backend
 from scipy.stats import norm
 import numpy as np
 
@@ -45,4 +46,15 @@ class GreeksCalculator:
         else:
             greeks['rho'] = (-K * T * np.exp(-r * T) * normal_cdf(-d2)) / 100
         
-        return greeks
\ No newline at end of file
+        return greeks
+    
+    @staticmethod
+    def calculate_all_greeks_vectorized(S, K, T, r, sigma, is_call, backend=None):
+        """Calculate all Greeks for arrays of contracts.
+
+        Uses the same units as calculate_all_greeks (daily theta, vega and
+        rho per 1% move). Expired contracts get zero gamma, theta, vega and
+        rho, and an intrinsic 0/1 delta. Runs on the active compute backend
+        unless `backend` names another.
+        """
+        return get_backend(backend).greeks(S, K, T, r, sigma, is_call)
@@ -4,7 +4,7 @@ import numpy as np
 from datetime import datetime, timedelta
 import plotly.graph_objects as go
 import plotly.express as px
-from data.data_streamer import DataStreamer
+from data.market_data_hub import MarketDataHub
 from core.black_scholes import BlackScholes
 from core.greeks_calculator import GreeksCalculator
 from utils.date_utils import calculate_time_to_expiry, get_weekly_expiry
@@ -15,7 +15,7 @@ class OptionChainDashboard:
     def __init__(self):
         self.bs = BlackScholes()
         self.greeks_calc = GreeksCalculator()
-        self.data_streamer = None
+        self.subscription = None
         self.current_price = None
         self.chain_data = []
         
@@ -345,25 +345,49 @@ class OptionChainDashboard:
         # Display current status
         status_placeholder = st.empty()
         
+        # Streamlit reruns recreate this object; per-session state lives in session_state
+        self.streaming_started = st.session_state.get('streaming_started', False)
+        self.subscription = st.session_state.get('subscription')
+        if self.subscription is not None:
+            if self.subscription.closed:
+                # Lease expired while this session was away
+                st.session_state.pop('subscription', None)
+                self.subscription = None
+                self.streaming_started = False
+            else:
+                self.subscription.renew()
+        
         # Initialize data streamer if starting
-        if config['start_btn'] and not hasattr(self, 'streaming_started'):
+        if config['start_btn'] and not self.streaming_started:
             self.streaming_started = True
             if config['data_source'] != 'mock_data':
-                self.data_streamer = DataStreamer(config['data_source'], config['update_interval'])
-                self.data_streamer.subscribe(self.on_price_update)
-                self.data_streamer.start_streaming([config['symbol']])
+                # One shared stream per (provider, symbol) across all sessions
+                self.close_subscription()
+                self.subscription = MarketDataHub.get_instance().subscribe(
+                    config['data_source'], config['symbol'],
+                    update_interval=config['update_interval'],
+                    lease_ttl=self.subscription_lease_ttl(config)
+                )
+                st.session_state['subscription'] = self.subscription
             else:
                 # Use mock data for demonstration
-                self.current_price = 180.50  # Mock price
                 self.start_mock_streaming(config)
         
-        if config['stop_btn'] and hasattr(self, 'streaming_started'):
+        if config['stop_btn']:
             self.streaming_started = False
-            if self.data_streamer:
-                self.data_streamer.stop_streaming()
+            self.close_subscription()
+            self.stop_mock_streaming()
+        
+        st.session_state['streaming_started'] = self.streaming_started
+        
+        if self.subscription is not None:
+            self.current_price = self.subscription.get_current_price() or self.current_price
+        mock_feed = st.session_state.get('mock_feed')
+        if mock_feed is not None:
+            self.current_price = mock_feed['price']
         
         # Calculate and display option chain
-        if hasattr(self, 'streaming_started') and self.streaming_started:
+        if self.streaming_started:
             status_placeholder.success(f"Live feed running - {config['symbol']}")
             
             # Calculate option chain
@@ -384,24 +408,41 @@ class OptionChainDashboard:
         else:
             status_placeholder.info("Live feed stopped - Configure and click 'Start Live Feed'")
     
-    def on_price_update(self, symbol, price, timestamp):
-        """Callback for price updates"""
-        self.current_price = price
+    def subscription_lease_ttl(self, config):
+        """Lease long enough to survive a few auto-refresh cycles"""
+        return max(30, 3 * config['update_interval'])
+    
+    def close_subscription(self):
+        """Release this session's market data subscription"""
+        subscription = st.session_state.pop('subscription', None)
+        if subscription is not None:
+            subscription.close()
+        self.subscription = None
     
     def start_mock_streaming(self, config):
         """Start mock data streaming for demonstration"""
+        self.stop_mock_streaming()
+        feed = {'running': True, 'price': 180.50}  # Mock price
+        st.session_state['mock_feed'] = feed
+        
         def mock_stream():
             import random
             base_price = 180.50
-            while hasattr(self, 'streaming_started') and self.streaming_started:
+            while feed['running']:
                 # Simulate price movement
                 movement = random.uniform(-2, 2)
-                self.current_price = base_price + movement
+                feed['price'] = base_price + movement
                 time.sleep(config['update_interval'])
         
         self.mock_thread = threading.Thread(target=mock_stream)
         self.mock_thread.daemon = True
         self.mock_thread.start()
+    
+    def stop_mock_streaming(self):
+        """Stop this session's mock data thread"""
+        feed = st.session_state.pop('mock_feed', None)
+        if feed is not None:
+            feed['running'] = False
 
 def main():
     dashboard = OptionChainDashboard()
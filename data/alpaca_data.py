@@ -1,7 +1,7 @@
 from api_config import ALPACA_CONFIG, SYMBOLS
 from alpaca.trading.client import TradingClient
 from alpaca.data.historical import StockHistoricalDataClient
-from alpaca.data.requests import StockBarsRequest
+from alpaca.data.requests import StockBarsRequest, StockLatestTradeRequest
 from alpaca.data.timeframe import TimeFrame
 from datetime import datetime, timedelta
 import pandas as pd
@@ -16,7 +16,8 @@ class AlpacaData:
             )
             self.data_client = StockHistoricalDataClient(
                 ALPACA_CONFIG['api_key'], 
-                ALPACA_CONFIG['api_secret']
+                ALPACA_CONFIG['api_secret'],
+                url_override=ALPACA_CONFIG.get('data_url')
             )
             print("Alpaca client initialized successfully")
         except Exception as e:
@@ -79,6 +80,18 @@ class AlpacaData:
             mock_prices = {'AAPL': 180.50, 'TSLA': 250.75, 'AMD': 120.30}
             return mock_prices.get(symbol, 100.00)
     
+    def get_current_prices(self, symbols):
+        """Get latest trade prices for several symbols in one request"""
+        if not self.data_client:
+            raise RuntimeError("Alpaca client not initialized")
+        
+        request_params = StockLatestTradeRequest(
+            symbol_or_symbols=list(symbols),
+            feed="iex"
+        )
+        trades = self.data_client.get_stock_latest_trade(request_params)
+        return {symbol: float(trade.price) for symbol, trade in trades.items()}
+    
     def _get_mock_data(self, symbol):
         """Generate mock data for testing"""
         dates = pd.date_range(end=datetime.now(), periods=100, freq='5min')
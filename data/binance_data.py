@@ -4,7 +4,12 @@ import pandas as pd
 
 class BinanceData:
     def __init__(self):
-        self.client = Client(BINANCE_CONFIG['api_key'], BINANCE_CONFIG['api_secret'])
+        api_url = BINANCE_CONFIG.get('api_url')
+        # Client pings its endpoint on construction; skip that when the
+        # endpoint is overridden so a local stub works offline
+        self.client = Client(BINANCE_CONFIG['api_key'], BINANCE_CONFIG['api_secret'], ping=not api_url)
+        if api_url:
+            self.client.API_URL = api_url
     
     def fetch_klines(self, symbol, interval, limit=50):
         """
@@ -29,4 +34,10 @@ class BinanceData:
     def get_current_price(self, symbol):
         """Get current cryptocurrency price"""
         df = self.fetch_klines(symbol, Client.KLINE_INTERVAL_1MINUTE, limit=1)
-        return float(df['close'].iloc[-1]) if not df.empty else None
\ No newline at end of file
+        return float(df['close'].iloc[-1]) if not df.empty else None
+    
+    def get_current_prices(self, symbols):
+        """Get latest prices for several symbols with one all-ticker request"""
+        wanted = set(symbols)
+        tickers = self.client.get_symbol_ticker()
+        return {ticker['symbol']: float(ticker['price']) for ticker in tickers if ticker['symbol'] in wanted}
\ No newline at end of file
@@ -1,83 +1,172 @@
 import threading
-import time
+from concurrent.futures import wait
 import pandas as pd
 from datetime import datetime
 from data.alpaca_data import AlpacaData
 from data.binance_data import BinanceData
+from data.replay_data import ReplayData
+from data.tick_log import TickLogWriter
+from data.request_scheduler import RequestScheduler
+from api_config import RATE_LIMITS
+
+def create_data_client(data_source, replay_path=None, replay_speed=1.0):
+    """Create the market data client for a data source"""
+    if data_source == 'alpaca':
+        return AlpacaData()
+    elif data_source == 'binance':
+        return BinanceData()
+    elif data_source == 'replay':
+        return ReplayData(replay_path, replay_speed)
 
 class DataStreamer:
-    def __init__(self, data_source='alpaca', update_interval=10):
+    def __init__(self, data_source='alpaca', update_interval=10, record_path=None,
+                 replay_path=None, replay_speed=1.0, scheduler=None):
         self.data_source = data_source
         self.update_interval = update_interval  # seconds
         self.is_running = False
         self.subscribers = []
+        self.subscribers_lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.stream_thread = None
+        
+        # A shared scheduler already holds a provider client, so only build
+        # one when fetching on our own (replay always reads its own log)
+        self.data_client = None
+        if scheduler is None or data_source == 'replay':
+            self.data_client = create_data_client(data_source, replay_path, replay_speed)
         
-        if data_source == 'alpaca':
-            self.data_client = AlpacaData()
-        elif data_source == 'binance':
-            self.data_client = BinanceData()
+        # Batched, rate-limited price requests (shared when a scheduler is passed in)
+        self.owns_scheduler = scheduler is None and data_source in RATE_LIMITS
+        if self.owns_scheduler:
+            scheduler = RequestScheduler.for_provider(data_source, self.data_client)
+        self.scheduler = scheduler
+        
+        # Optionally record every tick for offline replay
+        self.recorder = TickLogWriter(record_path) if record_path else None
         
         self.current_prices = {}
         self.price_history = {}
     
     def subscribe(self, callback):
         """Subscribe to price updates"""
-        self.subscribers.append(callback)
+        with self.subscribers_lock:
+            self.subscribers.append(callback)
+    
+    def unsubscribe(self, callback):
+        """Remove a previously subscribed callback"""
+        with self.subscribers_lock:
+            if callback in self.subscribers:
+                self.subscribers.remove(callback)
     
     def notify_subscribers(self, symbol, price, timestamp):
         """Notify all subscribers of price update"""
-        for callback in self.subscribers:
-            callback(symbol, price, timestamp)
+        with self.subscribers_lock:
+            subscribers = list(self.subscribers)
+        for callback in subscribers:
+            try:
+                callback(symbol, price, timestamp)
+            except Exception as e:
+                print(f"Error in subscriber callback for {symbol}: {e}")
     
     def start_streaming(self, symbols):
         """Start real-time data streaming"""
         self.is_running = True
+        self.stop_event.clear()
         self.symbols = symbols
         
         def stream_loop():
             while self.is_running:
                 try:
-                    for symbol in self.symbols:
-                        price = self.data_client.get_current_price(symbol)
+                    for symbol, price in self.fetch_prices():
                         timestamp = datetime.now()
                         
                         if price is not None:
-                            self.current_prices[symbol] = price
-                            
-                            # Store price history
-                            if symbol not in self.price_history:
-                                self.price_history[symbol] = []
-                            self.price_history[symbol].append({
-                                'timestamp': timestamp,
-                                'price': price
-                            })
-                            
-                            # Keep only last 100 prices
-                            if len(self.price_history[symbol]) > 100:
-                                self.price_history[symbol].pop(0)
-                            
-                            # Notify subscribers
-                            self.notify_subscribers(symbol, price, timestamp)
-                            
+                            self.handle_tick(symbol, price, timestamp)
                             print(f"{symbol}: ${price:.2f} at {timestamp.strftime('%H:%M:%S')}")
                     
-                    time.sleep(self.update_interval)
+                    self.stop_event.wait(self.update_interval)
                     
                 except Exception as e:
                     print(f"Error in streaming loop: {e}")
-                    time.sleep(self.update_interval)
+                    self.stop_event.wait(self.update_interval)
+        
+        def replay_loop():
+            ticks = self.data_client.iter_ticks(
+                self.symbols,
+                should_continue=lambda: self.is_running,
+                wait=self.stop_event.wait
+            )
+            for symbol, price, timestamp in ticks:
+                self.handle_tick(symbol, price, timestamp)
+            self.is_running = False
+            print(f"Replay finished for {self.symbols}")
         
         # Start streaming in a separate thread
-        self.stream_thread = threading.Thread(target=stream_loop)
+        target = replay_loop if self.data_source == 'replay' else stream_loop
+        self.stream_thread = threading.Thread(target=target)
         self.stream_thread.daemon = True
         self.stream_thread.start()
         print(f"Started real-time streaming for {symbols}")
     
-    def stop_streaming(self):
-        """Stop real-time data streaming"""
+    def stop_streaming(self, timeout=None):
+        """Stop real-time data streaming and wait for the stream thread to exit"""
         self.is_running = False
+        self.stop_event.set()
+        if self.owns_scheduler:
+            # Fails our queued requests so the stream thread is not left waiting
+            self.scheduler.stop()
+        if self.stream_thread is not None and self.stream_thread is not threading.current_thread():
+            self.stream_thread.join(timeout)
+        if self.recorder is not None:
+            self.recorder.close()
         print("Stopped real-time streaming")
     
+    def fetch_prices(self):
+        """Yield (symbol, price) for every streamed symbol"""
+        if self.scheduler is None:
+            for symbol in self.symbols:
+                yield symbol, self.data_client.get_current_price(symbol)
+            return
+        
+        # Queue every symbol first so the scheduler can batch them together
+        futures = [(symbol, self.scheduler.request(symbol)) for symbol in self.symbols]
+        
+        # The scheduler may hold requests through a rate-limit backoff, so
+        # wait in short steps to let stop_streaming return promptly
+        not_done = [future for _, future in futures]
+        while not_done:
+            if self.stop_event.is_set():
+                return
+            not_done = wait(not_done, timeout=0.1).not_done
+        
+        for symbol, future in futures:
+            try:
+                yield symbol, future.result()
+            except Exception as e:
+                print(f"Error fetching price for {symbol}: {e}")
+    
+    def handle_tick(self, symbol, price, timestamp):
+        """Record, store and fan out a single price update"""
+        if self.recorder is not None:
+            self.recorder.append(symbol, price, timestamp)
+        
+        self.current_prices[symbol] = price
+        
+        # Store price history
+        if symbol not in self.price_history:
+            self.price_history[symbol] = []
+        self.price_history[symbol].append({
+            'timestamp': timestamp,
+            'price': price
+        })
+        
+        # Keep only last 100 prices
+        if len(self.price_history[symbol]) > 100:
+            self.price_history[symbol].pop(0)
+        
+        # Notify subscribers
+        self.notify_subscribers(symbol, price, timestamp)
+    
     def get_current_price(self, symbol):
         """Get current price from stream"""
         return self.current_prices.get(symbol)
@@ -0,0 +1,226 @@
+import threading
+import time
+from data.data_streamer import DataStreamer, create_data_client
+from data.request_scheduler import RequestScheduler
+from api_config import RATE_LIMITS
+
+class Subscription:
+    """Handle returned by MarketDataHub.subscribe; close() to unsubscribe.
+
+    With a lease_ttl the subscription also expires unless renew() is called
+    at least every lease_ttl seconds, so owners that disappear without
+    closing (e.g. a closed browser tab) are eventually released by the hub.
+    """
+
+    def __init__(self, hub, data_source, symbol, callback, lease_ttl=None):
+        self.hub = hub
+        self.data_source = data_source
+        self.symbol = symbol
+        self.callback = callback
+        self.lease_ttl = lease_ttl
+        self.closed = False
+        self.renew()
+
+    def renew(self):
+        """Extend the lease by lease_ttl seconds from now"""
+        if self.lease_ttl is not None:
+            self.expires_at = time.monotonic() + self.lease_ttl
+
+    def is_expired(self, now=None):
+        if self.lease_ttl is None:
+            return False
+        return (time.monotonic() if now is None else now) >= self.expires_at
+
+    def get_current_price(self):
+        """Latest price seen by the shared stream"""
+        return self.hub.get_current_price(self.data_source, self.symbol)
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self.hub.unsubscribe(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class MarketDataHub:
+    """Process-wide owner of market data streams.
+
+    Keeps one reference-counted DataStreamer per (data_source, symbol) and
+    fans its updates out to every subscriber, so any number of dashboard
+    sessions watching the same symbol share a single polling loop. The
+    stream is stopped and its thread joined when the last subscriber leaves.
+    Streams for the same provider share one RequestScheduler, so their
+    symbols are fetched together in rate-limited batches. Each live
+    subscription marks its symbol as watched in that scheduler, which
+    serves watched symbols before one-off requests for other symbols made
+    directly on the scheduler (see scheduler_for). If a SharedPriceBoard is given, every update is also
+    published there for other processes to read. Leased subscriptions that
+    stop renewing are reaped by a background thread every reap_interval
+    seconds.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, shared_board=None, streamer_factory=DataStreamer, reap_interval=5.0):
+        self.shared_board = shared_board
+        self.streamer_factory = streamer_factory
+        self.streams = {}
+        self.ref_counts = {}
+        self.schedulers = {}
+        self.leases = set()
+        self.lock = threading.Lock()
+        self.reap_interval = reap_interval
+        self.reap_event = threading.Event()
+        self.reap_thread = None
+
+    @classmethod
+    def get_instance(cls):
+        """Return the process-wide hub, creating it on first use"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def subscribe(self, data_source, symbol, callback=None, update_interval=10, lease_ttl=None):
+        """Subscribe to updates for a symbol, starting its stream if needed.
+
+        The first subscriber's update_interval sets the polling rate for the
+        shared stream. With lease_ttl the subscription must be renewed at
+        least that often or it is released automatically.
+        """
+        key = (data_source, symbol)
+        with self.lock:
+            if key in self.streams:
+                return self._add_subscriber(key, callback, lease_ttl)
+
+        # Building provider clients can do network I/O, so keep it outside the lock
+        scheduler = self._get_scheduler(data_source)
+        streamer = self.streamer_factory(data_source, update_interval, scheduler=scheduler)
+        with self.lock:
+            if key in self.streams:
+                # Another session started this stream meanwhile; ours never ran
+                return self._add_subscriber(key, callback, lease_ttl)
+            if self.shared_board is not None:
+                streamer.subscribe(self._publish_shared(data_source))
+            self.streams[key] = streamer
+            self.ref_counts[key] = 0
+            subscription = self._add_subscriber(key, callback, lease_ttl)
+        streamer.start_streaming([symbol])
+        return subscription
+
+    def _add_subscriber(self, key, callback, lease_ttl):
+        """Attach a subscriber to a running stream (caller holds the lock)"""
+        if callback is not None:
+            self.streams[key].subscribe(callback)
+        self.ref_counts[key] += 1
+        scheduler = self.schedulers.get(key[0])
+        if scheduler is not None:
+            scheduler.watch(key[1])
+        subscription = Subscription(self, *key, callback, lease_ttl)
+        if lease_ttl is not None:
+            self.leases.add(subscription)
+            self._start_reaper()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """Drop a subscription, stopping the stream when it was the last one"""
+        key = (subscription.data_source, subscription.symbol)
+        with self.lock:
+            self.leases.discard(subscription)
+            streamer = self.streams.get(key)
+            if streamer is None:
+                return
+            if subscription.callback is not None:
+                streamer.unsubscribe(subscription.callback)
+            scheduler = self.schedulers.get(subscription.data_source)
+            if scheduler is not None:
+                scheduler.unwatch(subscription.symbol)
+            self.ref_counts[key] -= 1
+            if self.ref_counts[key] > 0:
+                return
+            del self.streams[key]
+            del self.ref_counts[key]
+        streamer.stop_streaming()
+
+    def _start_reaper(self):
+        if self.reap_thread is None or not self.reap_thread.is_alive():
+            self.reap_event.clear()
+            self.reap_thread = threading.Thread(target=self._reap_loop)
+            self.reap_thread.daemon = True
+            self.reap_thread.start()
+
+    def _reap_loop(self):
+        while not self.reap_event.wait(self.reap_interval):
+            self.reap_expired()
+
+    def reap_expired(self):
+        """Close leased subscriptions that were not renewed in time"""
+        now = time.monotonic()
+        with self.lock:
+            expired = [subscription for subscription in self.leases if subscription.is_expired(now)]
+        for subscription in expired:
+            print(f"Releasing expired subscription to {subscription.data_source}:{subscription.symbol}")
+            subscription.close()
+        return len(expired)
+
+    def _get_scheduler(self, data_source):
+        if data_source not in RATE_LIMITS:
+            return None
+        with self.lock:
+            scheduler = self.schedulers.get(data_source)
+        if scheduler is None:
+            # Schedulers start no thread until their first request, so a
+            # duplicate built by a concurrent caller is simply dropped
+            scheduler = RequestScheduler.for_provider(data_source, create_data_client(data_source))
+            with self.lock:
+                scheduler = self.schedulers.setdefault(data_source, scheduler)
+        return scheduler
+
+    def scheduler_for(self, data_source):
+        """The provider's shared RequestScheduler (None if it is not rate limited)"""
+        return self._get_scheduler(data_source)
+
+    def scheduler_stats(self):
+        """Request scheduler statistics per provider"""
+        return {data_source: scheduler.stats() for data_source, scheduler in self.schedulers.items()}
+
+    def _publish_shared(self, data_source):
+        def publish(symbol, price, timestamp):
+            self.shared_board.publish(data_source, symbol, price, timestamp)
+        return publish
+
+    def get_current_price(self, data_source, symbol):
+        """Latest price for a symbol, or None if it is not being streamed"""
+        streamer = self.streams.get((data_source, symbol))
+        return streamer.get_current_price(symbol) if streamer else None
+
+    def get_price_history(self, data_source, symbol):
+        """Recent price history for a symbol"""
+        streamer = self.streams.get((data_source, symbol))
+        return streamer.get_price_history(symbol) if streamer else []
+
+    def active_streams(self):
+        """Map of (data_source, symbol) to subscriber count"""
+        with self.lock:
+            return dict(self.ref_counts)
+
+    def shutdown(self):
+        """Stop every stream regardless of subscribers"""
+        self.reap_event.set()
+        with self.lock:
+            self.leases.clear()
+            streamers = list(self.streams.values())
+            self.streams.clear()
+            self.ref_counts.clear()
+        for streamer in streamers:
+            streamer.stop_streaming()
+        for scheduler in self.schedulers.values():
+            scheduler.stop()
+        self.schedulers.clear()
+        if self.shared_board is not None:
+            self.shared_board.close()
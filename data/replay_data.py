@@ -0,0 +1,44 @@
+import time
+from datetime import datetime
+from data.tick_log import TickLogReader
+
+class ReplayData:
+    """Replay ticks recorded by TickLogWriter.
+
+    `speed` scales the recorded gaps between ticks: 1 replays in real time,
+    10 replays ten times faster and None (or 0) replays as fast as possible.
+    """
+
+    def __init__(self, log_path, speed=1.0):
+        self.reader = TickLogReader(log_path)
+        self.speed = speed
+        self.last_prices = {}
+
+    def iter_ticks(self, symbols=None, should_continue=lambda: True, wait=time.sleep):
+        """Yield (symbol, price, timestamp) in recorded order, paced by speed"""
+        records = self.reader.select(symbols)
+        if not len(records):
+            return
+
+        timestamps_ns = records['timestamp_ns']
+        prices = records['price']
+        symbol_ids = records['symbol_id']
+        replay_start = time.perf_counter()
+        first_ns = int(timestamps_ns[0])
+
+        for i in range(len(records)):
+            if not should_continue():
+                return
+            if self.speed:
+                due = replay_start + (int(timestamps_ns[i]) - first_ns) / 1e9 / self.speed
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    wait(delay)
+            symbol = self.reader.symbols[symbol_ids[i]]
+            price = float(prices[i])
+            self.last_prices[symbol] = price
+            yield symbol, price, datetime.fromtimestamp(int(timestamps_ns[i]) / 1e9)
+
+    def get_current_price(self, symbol):
+        """Last replayed price for a symbol"""
+        return self.last_prices.get(symbol)
@@ -0,0 +1,221 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+import numpy as np
+
+class TokenBucket:
+    """Token bucket refilled at `rate` tokens per second up to `capacity`"""
+
+    def __init__(self, rate, capacity, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.tokens = capacity
+        self.updated = clock()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, tokens=1):
+        """Seconds until `tokens` can be taken (0 if available now)"""
+        with self.lock:
+            now = self.clock()
+            self._refill(now)
+            wait = max(0.0, (tokens - self.tokens) / self.rate)
+            return max(wait, self.blocked_until - now)
+
+    def try_acquire(self, tokens=1):
+        """Take tokens if available without waiting"""
+        with self.lock:
+            now = self.clock()
+            self._refill(now)
+            if now < self.blocked_until or self.tokens < tokens:
+                return False
+            self.tokens -= tokens
+            return True
+
+    def penalize(self, seconds):
+        """Block the bucket, e.g. after the provider answered HTTP 429"""
+        with self.lock:
+            self.tokens = 0
+            self.blocked_until = max(self.blocked_until, self.clock() + seconds)
+
+RATE_LIMIT_MESSAGES = ('rate limit', 'too many requests')
+
+def is_rate_limit_error(error):
+    """Detect a provider rate-limit response (HTTP 429 or explicit rate-limit text)"""
+    status = getattr(error, 'status_code', None) or getattr(getattr(error, 'response', None), 'status_code', None)
+    message = str(error).lower()
+    return status == 429 or any(text in message for text in RATE_LIMIT_MESSAGES)
+
+class RequestScheduler:
+    """Merge per-symbol price requests into paced, batched provider calls.
+
+    Callers ask for a symbol with `request` and get a Future. Requests for a
+    symbol that is already queued share one Future. A worker thread lets
+    requests accumulate for `batch_window` seconds, then takes up to
+    `max_batch_size` queued symbols per call, watched symbols (those with
+    active subscribers) first, and paces calls with a token bucket sized to
+    the provider's rate limit. Rate-limit errors back the bucket off
+    exponentially; other errors are reported to the waiting callers instead
+    of being replaced with mock prices.
+    """
+
+    def __init__(self, fetch_batch, requests_per_minute, max_batch_size=100, burst=None,
+                 batch_window=0.05, max_backoff=60.0, clock=time.monotonic):
+        self.fetch_batch = fetch_batch
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window
+        self.bucket = TokenBucket(requests_per_minute / 60.0, burst or max(1, requests_per_minute // 10), clock)
+        self.max_backoff = max_backoff
+        self.backoff = 1.0
+        self.clock = clock
+
+        self.pending = OrderedDict()  # symbol -> (future, enqueued_at)
+        self.watched = {}
+        self.condition = threading.Condition()
+        self.is_running = False
+        self.worker_thread = None
+
+        self.calls = 0
+        self.requests = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self.latencies = []
+
+    @classmethod
+    def for_provider(cls, data_source, data_client):
+        """Build a scheduler using the provider's configured rate limits"""
+        from api_config import RATE_LIMITS  # api_config imports every provider SDK
+        limits = RATE_LIMITS[data_source]
+        return cls(
+            data_client.get_current_prices,
+            limits['requests_per_minute'],
+            limits['max_symbols_per_request']
+        )
+
+    def watch(self, symbol):
+        """Mark a symbol as watched by an active subscriber"""
+        with self.condition:
+            self.watched[symbol] = self.watched.get(symbol, 0) + 1
+
+    def unwatch(self, symbol):
+        with self.condition:
+            count = self.watched.get(symbol, 0) - 1
+            if count > 0:
+                self.watched[symbol] = count
+            else:
+                self.watched.pop(symbol, None)
+
+    def request(self, symbol):
+        """Queue a price request; returns a Future resolving to the price or None"""
+        with self.condition:
+            if not self.is_running:
+                self._start()
+            entry = self.pending.get(symbol)
+            if entry is None:
+                entry = (Future(), self.clock())
+                self.pending[symbol] = entry
+                self.condition.notify()
+            return entry[0]
+
+    def _start(self):
+        self.is_running = True
+        self.worker_thread = threading.Thread(target=self._run)
+        self.worker_thread.daemon = True
+        self.worker_thread.start()
+
+    def stop(self):
+        """Stop the worker and fail any queued requests"""
+        with self.condition:
+            self.is_running = False
+            self.condition.notify_all()
+            pending = list(self.pending.values())
+            self.pending.clear()
+        if self.worker_thread is not None and self.worker_thread is not threading.current_thread():
+            self.worker_thread.join()
+        for future, _ in pending:
+            if not future.done():
+                future.set_exception(RuntimeError("Request scheduler stopped"))
+
+    def _next_batch(self):
+        """Pop up to max_batch_size symbols, watched symbols first"""
+        watched = [symbol for symbol in self.pending if symbol in self.watched]
+        others = [symbol for symbol in self.pending if symbol not in self.watched]
+        symbols = (watched + others)[:self.max_batch_size]
+        return [(symbol, *self.pending.pop(symbol)) for symbol in symbols]
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while self.is_running and not self.pending:
+                    self.condition.wait()
+                if not self.is_running:
+                    return
+                oldest = next(iter(self.pending.values()))[1]
+                linger = oldest + self.batch_window - self.clock()
+                if linger > 0 and len(self.pending) < self.max_batch_size:
+                    self.condition.wait(linger)
+                    continue
+
+            wait = self.bucket.wait_time()
+            if wait > 0:
+                with self.condition:
+                    self.condition.wait(wait)
+                continue
+            if not self.bucket.try_acquire():
+                continue
+
+            with self.condition:
+                batch = self._next_batch()
+            if not batch:
+                continue
+            self._execute(batch)
+
+    def _execute(self, batch):
+        symbols = [symbol for symbol, _, _ in batch]
+        self.calls += 1
+        self.requests += len(batch)
+        try:
+            prices = self.fetch_batch(symbols)
+        except Exception as e:
+            self.errors += 1
+            if is_rate_limit_error(e):
+                self.rate_limited += 1
+                self.bucket.penalize(self.backoff)
+                self.backoff = min(self.backoff * 2, self.max_backoff)
+            print(f"Error fetching prices for {symbols}: {e}")
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+
+        self.backoff = 1.0
+        now = self.clock()
+        for symbol, future, enqueued_at in batch:
+            self.latencies.append(now - enqueued_at)
+            future.set_result(prices.get(symbol))
+        if len(self.latencies) > 1000:
+            del self.latencies[:-1000]
+
+    def stats(self):
+        """Queue depth, call counts and request latency (seconds)"""
+        with self.condition:
+            queued = len(self.pending)
+            watched = len(self.watched)
+        latencies = np.array(self.latencies[-1000:])
+        return {
+            'queued': queued,
+            'watched': watched,
+            'calls': self.calls,
+            'requests': self.requests,
+            'errors': self.errors,
+            'rate_limited': self.rate_limited,
+            'avg_batch_size': self.requests / self.calls if self.calls else 0.0,
+            'latency_p50': float(np.percentile(latencies, 50)) if len(latencies) else None,
+            'latency_p95': float(np.percentile(latencies, 95)) if len(latencies) else None,
+            'wait_for_token': self.bucket.wait_time()
+        }
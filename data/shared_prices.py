@@ -0,0 +1,95 @@
+from multiprocessing import shared_memory
+import numpy as np
+
+SLOT_DTYPE = np.dtype([
+    ('key', 'S32'),
+    ('seq', '<u8'),
+    ('price', '<f8'),
+    ('timestamp', '<f8')
+])
+
+class SharedPriceBoard:
+    """Latest prices published in shared memory for other server processes.
+
+    The board is a fixed array of slots, one per (provider, symbol), keyed
+    by "provider:SYMBOL". A single process writes; any number of processes
+    attach by name and read. Each slot carries a sequence counter that is
+    odd while a write is in progress, so readers retry instead of seeing a
+    half-written price.
+    """
+
+    def __init__(self, name=None, capacity=256, create=True):
+        if create:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=capacity * SLOT_DTYPE.itemsize)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.slots = np.ndarray((self.shm.size // SLOT_DTYPE.itemsize,), dtype=SLOT_DTYPE, buffer=self.shm.buf)
+        if create:
+            self.slots[:] = np.zeros(len(self.slots), dtype=SLOT_DTYPE)
+        self.owner = create
+        self.slot_index = {}
+
+    @classmethod
+    def attach(cls, name):
+        """Attach to a board created by another process"""
+        return cls(name=name, create=False)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @staticmethod
+    def make_key(data_source, symbol):
+        return f"{data_source}:{symbol}".encode()[:SLOT_DTYPE['key'].itemsize]
+
+    def _find_slot(self, key):
+        if key in self.slot_index:
+            return self.slot_index[key]
+        matches = np.flatnonzero(self.slots['key'] == key)
+        if len(matches):
+            self.slot_index[key] = int(matches[0])
+            return self.slot_index[key]
+        return None
+
+    def publish(self, data_source, symbol, price, timestamp):
+        """Write the latest price for a symbol (writer process only)"""
+        key = self.make_key(data_source, symbol)
+        index = self._find_slot(key)
+        if index is None:
+            empty = np.flatnonzero(self.slots['key'] == b'')
+            if not len(empty):
+                print(f"Shared price board full - not publishing {symbol}")
+                return
+            index = int(empty[0])
+            self.slot_index[key] = index
+
+        slot = self.slots[index:index + 1]
+        slot['seq'] += 1
+        slot['key'] = key
+        slot['price'] = price
+        slot['timestamp'] = timestamp.timestamp() if hasattr(timestamp, 'timestamp') else timestamp
+        slot['seq'] += 1
+
+    def read(self, data_source, symbol, retries=100):
+        """Return (price, unix_timestamp) for a symbol, or None if unpublished"""
+        index = self._find_slot(self.make_key(data_source, symbol))
+        if index is None:
+            return None
+
+        slot = self.slots[index:index + 1]
+        for _ in range(retries):
+            seq = int(slot['seq'][0])
+            if seq % 2:
+                continue
+            price = float(slot['price'][0])
+            timestamp = float(slot['timestamp'][0])
+            if int(slot['seq'][0]) == seq:
+                return price, timestamp
+        return None
+
+    def close(self):
+        """Detach from the board, removing it if this process created it"""
+        self.slots = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
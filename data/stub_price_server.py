@@ -0,0 +1,101 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError
+from urllib.parse import parse_qs, quote, urlparse
+from urllib.request import urlopen
+
+TICKER_PATH = '/api/v3/ticker/price'
+
+class StubPriceHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        """Handle GET /api/v3/ticker/price?symbols=["A","B"] like Binance"""
+        url = urlparse(self.path)
+        if url.path != TICKER_PATH:
+            self._send(404, {'msg': f"Unknown path {url.path}"})
+            return
+        query = parse_qs(url.query)
+        symbols = json.loads(query['symbols'][0]) if 'symbols' in query else list(self.server.prices)
+
+        server = self.server
+        with server.lock:
+            server.calls.append(symbols)
+            rate_limited = server.rate_limit_next > 0
+            if rate_limited:
+                server.rate_limit_next -= 1
+        if rate_limited:
+            self._send(429, {'code': -1003, 'msg': 'Too many requests'})
+            return
+        self._send(200, [
+            {'symbol': symbol, 'price': str(server.prices[symbol])}
+            for symbol in symbols if symbol in server.prices
+        ])
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class StubPriceServer(ThreadingHTTPServer):
+    """Local stand-in for a provider's latest-price endpoint.
+
+    Serves a fixed price table in Binance's ticker format, records the
+    symbol list of every call and can answer the next `rate_limit_next`
+    calls with HTTP 429, so batching and backoff can be checked offline.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, prices, host='127.0.0.1', port=0):
+        super().__init__((host, port), StubPriceHandler)
+        self.prices = dict(prices)
+        self.calls = []
+        self.rate_limit_next = 0
+        self.lock = threading.Lock()
+        self.serve_thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve on a background thread"""
+        self.serve_thread = threading.Thread(target=self.serve_forever)
+        self.serve_thread.daemon = True
+        self.serve_thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+class StubAPIError(Exception):
+    """HTTP error from the stub server, carrying the status code like the provider SDKs"""
+
+    def __init__(self, status_code, message):
+        super().__init__(f"{status_code}: {message}")
+        self.status_code = status_code
+
+class StubPriceClient:
+    """Minimal data client for the stub server, usable as a RequestScheduler fetch_batch"""
+
+    def __init__(self, base_url, timeout=5.0):
+        self.base_url = base_url
+        self.timeout = timeout
+
+    def get_current_prices(self, symbols):
+        """Latest prices for a list of symbols in one call"""
+        url = f"{self.base_url}{TICKER_PATH}?symbols={quote(json.dumps(list(symbols)))}"
+        try:
+            with urlopen(url, timeout=self.timeout) as response:
+                tickers = json.loads(response.read())
+        except HTTPError as e:
+            raise StubAPIError(e.code, json.loads(e.read()).get('msg', e.reason)) from e
+        return {ticker['symbol']: float(ticker['price']) for ticker in tickers}
@@ -0,0 +1,163 @@
+import json
+import os
+import threading
+import numpy as np
+
+MAGIC = b'BSTICK01'
+HEADER_SIZE = 16
+RECORD_DTYPE = np.dtype([
+    ('timestamp_ns', '<i8'),
+    ('symbol_id', '<u4'),
+    ('flags', '<u4'),
+    ('price', '<f8')
+])
+
+def symbols_path(path):
+    return path + '.symbols.json'
+
+def index_path(path):
+    return path + '.idx.npz'
+
+def _load_symbols(path):
+    if os.path.exists(symbols_path(path)):
+        with open(symbols_path(path)) as f:
+            return json.load(f)
+    return []
+
+class TickLogWriter:
+    """Append ticks to a fixed-layout binary log.
+
+    The log is a 16-byte header (magic + record size) followed by 24-byte
+    records of (timestamp_ns, symbol_id, flags, price), so it can be
+    memory-mapped directly as a NumPy structured array. Symbol names live in
+    a JSON sidecar and are referenced by id. On close a per-symbol index of
+    record positions is written next to the log.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.symbols = _load_symbols(path)
+        self.symbol_ids = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        if not is_new:
+            with open(path, 'rb') as f:
+                header = f.read(HEADER_SIZE)
+            if header[:8] != MAGIC:
+                raise ValueError(f"{path} is not a tick log")
+            size = os.path.getsize(path)
+            torn = (size - HEADER_SIZE) % RECORD_DTYPE.itemsize
+            if torn:
+                # Drop a partially written record left by a crash
+                os.truncate(path, size - torn)
+
+        self.file = open(path, 'ab')
+        if is_new:
+            self.file.write(MAGIC + np.array([RECORD_DTYPE.itemsize, 0], dtype='<u4').tobytes())
+        self.record = np.zeros(1, dtype=RECORD_DTYPE)
+
+    def _symbol_id(self, symbol):
+        symbol_id = self.symbol_ids.get(symbol)
+        if symbol_id is None:
+            symbol_id = len(self.symbols)
+            self.symbols.append(symbol)
+            self.symbol_ids[symbol] = symbol_id
+            with open(symbols_path(self.path), 'w') as f:
+                json.dump(self.symbols, f)
+        return symbol_id
+
+    def append(self, symbol, price, timestamp):
+        """Append one tick; timestamp is a datetime or nanoseconds since epoch"""
+        if hasattr(timestamp, 'timestamp'):
+            timestamp = int(timestamp.timestamp() * 1e9)
+        with self.lock:
+            self.record['timestamp_ns'] = timestamp
+            self.record['symbol_id'] = self._symbol_id(symbol)
+            self.record['price'] = price
+            self.file.write(self.record.tobytes())
+
+    def flush(self):
+        with self.lock:
+            self.file.flush()
+
+    def close(self):
+        """Close the log and write the per-symbol index"""
+        with self.lock:
+            if self.file.closed:
+                return
+            self.file.close()
+        TickLogReader(self.path).write_index()
+
+class TickLogReader:
+    """Memory-mapped read access to a tick log"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            header = f.read(HEADER_SIZE)
+        if header[:8] != MAGIC:
+            raise ValueError(f"{path} is not a tick log")
+        record_size = int(np.frombuffer(header[8:12], dtype='<u4')[0])
+        if record_size != RECORD_DTYPE.itemsize:
+            raise ValueError(f"Unsupported tick record size {record_size}")
+
+        count = (os.path.getsize(path) - HEADER_SIZE) // RECORD_DTYPE.itemsize
+        if count:
+            self.records = np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=HEADER_SIZE, shape=(count,))
+        else:
+            self.records = np.zeros(0, dtype=RECORD_DTYPE)
+        self.symbols = _load_symbols(path)
+        self._index = None
+
+    def __len__(self):
+        return len(self.records)
+
+    def _load_index(self):
+        if self._index is not None:
+            return self._index
+        if os.path.exists(index_path(self.path)):
+            with np.load(index_path(self.path)) as saved:
+                if int(saved['count']) == len(self.records):
+                    self._index = {symbol: saved[f'sym_{i}'] for i, symbol in enumerate(self.symbols)
+                                   if f'sym_{i}' in saved.files}
+                    return self._index
+        self._index = self._build_index()
+        return self._index
+
+    def _build_index(self):
+        ids = np.asarray(self.records['symbol_id'])
+        order = np.argsort(ids, kind='stable')
+        boundaries = np.searchsorted(ids[order], np.arange(len(self.symbols) + 1))
+        return {
+            symbol: order[boundaries[i]:boundaries[i + 1]]
+            for i, symbol in enumerate(self.symbols)
+        }
+
+    def write_index(self):
+        """Persist the per-symbol record positions next to the log"""
+        index = self._build_index()
+        arrays = {f'sym_{i}': index[symbol] for i, symbol in enumerate(self.symbols)}
+        np.savez(index_path(self.path), count=len(self.records), **arrays)
+        self._index = index
+
+    def symbol_records(self, symbol):
+        """All records for one symbol, in log order"""
+        positions = self._load_index().get(symbol)
+        if positions is None:
+            return np.zeros(0, dtype=RECORD_DTYPE)
+        return self.records[positions]
+
+    def select(self, symbols=None):
+        """Records for the given symbols (all if None) in log order.
+
+        Ticks are appended in time order, so no sorting is needed. With no
+        symbols the memory-mapped records are returned as is, without
+        reading the log into memory.
+        """
+        if symbols is None:
+            return self.records
+        positions = [self._load_index().get(symbol, np.zeros(0, dtype=np.int64)) for symbol in symbols]
+        if not positions:
+            return self.records[:0]
+        return self.records[np.sort(np.concatenate(positions))]
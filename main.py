@@ -1,10 +1,13 @@
-import streamlit.web.cli as stcli
+import argparse
 import sys
 import os
+from datetime import datetime
 
 def main():
     """Launch the Streamlit dashboard"""
     try:
+        import streamlit.web.cli as stcli
+        
         print("Starting Option Chain Dashboard...")
         print("Opening web browser at http://localhost:8501")
         
@@ -24,5 +27,145 @@ def main():
         print(f"Error starting dashboard: {e}")
         print("Make sure Streamlit is installed: pip install streamlit plotly")
 
+def run_batch(args):
+    """Price a contract file headlessly and write results to Parquet"""
+    from core.batch_pricer import BatchPricer
+    
+    pricer = BatchPricer(
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        valuation_time=args.valuation_time,
+        trading_time=args.trading_time
+    )
+    pricer.run(args.input, args.output)
+
+def run_server(args):
+    """Run the local pricing service"""
+    from service.pricing_server import PricingServer
+    
+    server = PricingServer(
+        host=args.host,
+        port=args.port,
+        window=args.window_ms / 1000,
+        max_batch=args.max_batch
+    )
+    server.serve()
+
+def run_load_test(args):
+    """Drive the pricing service with concurrent clients"""
+    from service.load_generator import LoadGenerator
+    
+    LoadGenerator(
+        host=args.host,
+        port=args.port,
+        concurrency=args.concurrency,
+        duration=args.duration,
+        contracts_per_request=args.contracts,
+        use_msgpack=args.msgpack
+    ).report()
+
+def run_replay(args):
+    """Replay a tick log through the streamer and price a chain on every tick"""
+    import time
+    import numpy as np
+    from data.data_streamer import DataStreamer
+    from core.black_scholes import BlackScholes
+    from core.greeks_calculator import GreeksCalculator
+    
+    speed = None if args.speed == 'max' else float(args.speed)
+    streamer = DataStreamer('replay', replay_path=args.log, replay_speed=speed)
+    moneyness = np.linspace(0.8, 1.2, args.strikes)
+    is_call = np.repeat([True, False], args.strikes)
+    latencies = []
+    
+    def price_chain(symbol, price, timestamp):
+        start = time.perf_counter()
+        strikes = np.tile(price * moneyness, 2)
+        BlackScholes.calculate_prices(price, strikes, args.expiry, args.rate, args.volatility, is_call)
+        GreeksCalculator.calculate_all_greeks_vectorized(price, strikes, args.expiry, args.rate, args.volatility, is_call)
+        latencies.append(time.perf_counter() - start)
+    
+    streamer.subscribe(price_chain)
+    start = time.perf_counter()
+    streamer.start_streaming(args.symbols)
+    streamer.stream_thread.join()
+    elapsed = time.perf_counter() - start
+    
+    latencies_us = np.array(latencies) * 1e6
+    print(f"Replayed {len(latencies):,} ticks in {elapsed:.2f}s ({len(latencies) / elapsed:,.0f} ticks/s)")
+    if len(latencies):
+        print(f"Chain pricing per tick: p50 {np.percentile(latencies_us, 50):.0f} us, "
+              f"p99 {np.percentile(latencies_us, 99):.0f} us")
+
+def run_backend_benchmark(args):
+    """Check backend accuracy and compare throughput"""
+    from core.backend_benchmark import report
+    
+    if not report(n=args.contracts):
+        sys.exit(1)
+
+def parse_args(argv):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Black-Scholes option pricing")
+    parser.add_argument('--backend', default=None,
+                        help="Compute backend: numpy, float32, numba or numba32 (default: $BS_BACKEND or numpy)")
+    subparsers = parser.add_subparsers(dest='command')
+    
+    subparsers.add_parser('dashboard', help="Launch the Streamlit dashboard (default)")
+    
+    batch = subparsers.add_parser('batch', help="Price contracts from CSV/Parquet to Parquet")
+    batch.add_argument('input', help="CSV or Parquet file with columns S, K, T (or expiry), r, sigma, type")
+    batch.add_argument('output', help="Output Parquet file")
+    batch.add_argument('--chunk-size', type=int, default=250_000, help="Contracts per chunk")
+    batch.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    batch.add_argument('--valuation-time', type=datetime.fromisoformat, default=None,
+                       help="Snapshot time for expiry columns, ISO format (default: now)")
+    batch.add_argument('--trading-time', action='store_true', help="Measure expiries in trading time")
+    
+    serve = subparsers.add_parser('serve', help="Run the local micro-batching pricing server")
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8600)
+    serve.add_argument('--window-ms', type=float, default=2.0, help="Batching window in milliseconds")
+    serve.add_argument('--max-batch', type=int, default=100_000, help="Maximum contracts per batch")
+    
+    loadtest = subparsers.add_parser('loadtest', help="Measure pricing server throughput and latency")
+    loadtest.add_argument('--host', default='127.0.0.1')
+    loadtest.add_argument('--port', type=int, default=8600)
+    loadtest.add_argument('--concurrency', type=int, default=16, help="Concurrent clients")
+    loadtest.add_argument('--duration', type=float, default=10, help="Test length in seconds")
+    loadtest.add_argument('--contracts', type=int, default=1, help="Contracts per request")
+    loadtest.add_argument('--msgpack', action='store_true', help="Send msgpack instead of JSON")
+    
+    replay = subparsers.add_parser('replay', help="Replay a recorded tick log and benchmark chain pricing")
+    replay.add_argument('log', help="Tick log written by DataStreamer(record_path=...)")
+    replay.add_argument('--speed', default='max', help="Replay speed multiplier, or 'max'")
+    replay.add_argument('--symbols', nargs='*', default=None, help="Symbols to replay (default: all)")
+    replay.add_argument('--strikes', type=int, default=41, help="Strikes per chain")
+    replay.add_argument('--expiry', type=float, default=7 / 365, help="Time to expiry in years")
+    replay.add_argument('--rate', type=float, default=0.07)
+    replay.add_argument('--volatility', type=float, default=0.20)
+    
+    backends = subparsers.add_parser('backends', help="Check accuracy and benchmark the compute backends")
+    backends.add_argument('--contracts', type=int, default=1_000_000, help="Contracts in the accuracy check")
+    
+    return parser.parse_args(argv)
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    args = parse_args(sys.argv[1:])
+    if args.backend:
+        from core.backends import set_backend
+        
+        set_backend(args.backend)
+        os.environ['BS_BACKEND'] = args.backend  # picked up by worker processes
+    if args.command == 'batch':
+        run_batch(args)
+    elif args.command == 'serve':
+        run_server(args)
+    elif args.command == 'loadtest':
+        run_load_test(args)
+    elif args.command == 'replay':
+        run_replay(args)
+    elif args.command == 'backends':
+        run_backend_benchmark(args)
+    else:
+        main()
@@ -0,0 +1,112 @@
+import http.client
+import json
+import random
+import threading
+import time
+import numpy as np
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+def make_contracts(count, rng):
+    """Generate random contracts around a 100 underlying"""
+    return [
+        {
+            'S': 100.0,
+            'K': rng.uniform(50, 150),
+            'T': rng.uniform(0.01, 2.0),
+            'r': 0.05,
+            'sigma': rng.uniform(0.1, 0.6),
+            'type': rng.choice(['call', 'put'])
+        }
+        for _ in range(count)
+    ]
+
+class LoadGenerator:
+    """Drive a pricing server with concurrent clients and report latency"""
+
+    def __init__(self, host='127.0.0.1', port=8600, concurrency=16, duration=10,
+                 contracts_per_request=1, use_msgpack=False):
+        if use_msgpack and msgpack is None:
+            raise ImportError("msgpack is required for --msgpack: pip install msgpack")
+        self.host = host
+        self.port = port
+        self.concurrency = concurrency
+        self.duration = duration
+        self.contracts_per_request = contracts_per_request
+        self.use_msgpack = use_msgpack
+        self.latencies = []
+        self.errors = 0
+        self.lock = threading.Lock()
+
+    def _encode(self, payload):
+        if self.use_msgpack:
+            return msgpack.packb(payload), 'application/msgpack'
+        return json.dumps(payload).encode(), 'application/json'
+
+    def _client(self, seed, deadline):
+        rng = random.Random(seed)
+        connection = http.client.HTTPConnection(self.host, self.port)
+        latencies = []
+        errors = 0
+        while time.perf_counter() < deadline:
+            body, content_type = self._encode({'contracts': make_contracts(self.contracts_per_request, rng)})
+            start = time.perf_counter()
+            try:
+                connection.request('POST', '/price', body, {'Content-Type': content_type})
+                response = connection.getresponse()
+                response.read()
+                if response.status != 200:
+                    errors += 1
+                    continue
+            except (OSError, http.client.HTTPException):
+                errors += 1
+                connection.close()
+                connection = http.client.HTTPConnection(self.host, self.port)
+                continue
+            latencies.append(time.perf_counter() - start)
+        connection.close()
+
+        with self.lock:
+            self.latencies.extend(latencies)
+            self.errors += errors
+
+    def run(self):
+        """Run the load test and return a summary dict"""
+        deadline = time.perf_counter() + self.duration
+        threads = [
+            threading.Thread(target=self._client, args=(seed, deadline))
+            for seed in range(self.concurrency)
+        ]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        latencies_ms = np.array(self.latencies) * 1000
+        requests = len(latencies_ms)
+        summary = {
+            'requests': requests,
+            'errors': self.errors,
+            'requests_per_sec': requests / elapsed,
+            'contracts_per_sec': requests * self.contracts_per_request / elapsed
+        }
+        for label, pct in [('p50_ms', 50), ('p95_ms', 95), ('p99_ms', 99), ('p999_ms', 99.9)]:
+            summary[label] = float(np.percentile(latencies_ms, pct)) if requests else float('nan')
+        return summary
+
+    def report(self):
+        """Run the load test and print the results"""
+        print(f"Load test: {self.concurrency} clients x {self.duration}s, "
+              f"{self.contracts_per_request} contract(s)/request against {self.host}:{self.port}")
+        summary = self.run()
+        print(f"Requests:   {summary['requests']:,} ({summary['errors']} errors)")
+        print(f"Throughput: {summary['requests_per_sec']:,.0f} req/s, "
+              f"{summary['contracts_per_sec']:,.0f} contracts/s")
+        print(f"Latency:    p50 {summary['p50_ms']:.2f} ms, p95 {summary['p95_ms']:.2f} ms, "
+              f"p99 {summary['p99_ms']:.2f} ms, p99.9 {summary['p999_ms']:.2f} ms")
+        return summary
@@ -0,0 +1,209 @@
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+from core.black_scholes import BlackScholes
+from core.greeks_calculator import GreeksCalculator
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional, JSON is always available
+    msgpack = None
+
+CONTRACT_FIELDS = ['S', 'K', 'T', 'r', 'sigma']
+POSITIVE_FIELDS = {'S', 'K', 'sigma'}
+GREEK_FIELDS = ['delta', 'gamma', 'theta', 'vega', 'rho']
+MSGPACK_CONTENT_TYPE = 'application/msgpack'
+
+class MicroBatcher:
+    """Coalesce concurrent pricing requests into one vectorized batch.
+
+    Callers block in `submit` while a single worker thread collects every
+    request that arrives within `window` seconds of the first one (up to
+    `max_batch` contracts), prices them in one call to the vectorized core
+    and hands each caller back its own slice of the results.
+    """
+
+    def __init__(self, window=0.002, max_batch=100_000):
+        self.window = window
+        self.max_batch = max_batch
+        self.requests = queue.Queue()
+        self.batches = 0
+        self.contracts = 0
+        self.is_running = True
+        self.worker_thread = threading.Thread(target=self._run)
+        self.worker_thread.daemon = True
+        self.worker_thread.start()
+
+    def submit(self, columns, is_call):
+        """Price a block of contracts and return a dict of result arrays"""
+        future = Future()
+        self.requests.put((columns, is_call, future))
+        return future.result()
+
+    def stop(self):
+        """Stop the worker thread"""
+        self.is_running = False
+        self.requests.put(None)
+        self.worker_thread.join()
+
+    def _collect(self, first):
+        """Gather requests arriving within the batching window"""
+        batch = [first]
+        size = len(first[1])
+        deadline = time.perf_counter() + self.window
+        while size < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self.requests.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                self.is_running = False
+                break
+            batch.append(item)
+            size += len(item[1])
+        return batch
+
+    def _run(self):
+        while self.is_running:
+            first = self.requests.get()
+            if first is None:
+                break
+            batch = self._collect(first)
+            try:
+                columns = [np.concatenate([item[0][i] for item in batch]) for i in range(len(CONTRACT_FIELDS))]
+                is_call = np.concatenate([item[1] for item in batch])
+                results = GreeksCalculator.calculate_all_greeks_vectorized(*columns, is_call)
+                results['price'] = BlackScholes.calculate_prices(*columns, is_call)
+            except Exception as e:
+                for _, _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            self.batches += 1
+            self.contracts += len(is_call)
+            offset = 0
+            for _, item_is_call, future in batch:
+                end = offset + len(item_is_call)
+                future.set_result({name: values[offset:end] for name, values in results.items()})
+                offset = end
+
+def parse_contracts(payload):
+    """Convert a request payload into column arrays and a call/put mask.
+
+    The payload is either a single contract or {"contracts": [...]}, where
+    each contract has S, K, T, r, sigma and an optional type (default call).
+    Raises ValueError for non-finite inputs or non-positive S, K or sigma.
+    """
+    contracts = payload['contracts'] if 'contracts' in payload else [payload]
+    columns = tuple(
+        np.array([float(contract[field]) for contract in contracts], dtype=np.float64)
+        for field in CONTRACT_FIELDS
+    )
+    for field, values in zip(CONTRACT_FIELDS, columns):
+        if not np.all(np.isfinite(values)):
+            raise ValueError(f"{field} must be finite")
+        if field in POSITIVE_FIELDS and np.any(values <= 0):
+            raise ValueError(f"{field} must be positive")
+    is_call = np.array(
+        [str(contract.get('type', 'call')).lower().startswith('c') for contract in contracts],
+        dtype=bool
+    )
+    return columns, is_call
+
+def finite_or_none(value):
+    """Convert a result to float, mapping NaN/inf to None (JSON null)"""
+    value = float(value)
+    return value if np.isfinite(value) else None
+
+class PricingRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out in separate writes; without TCP_NODELAY Nagle's
+    # algorithm and delayed ACKs add ~40 ms to every keep-alive response
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        """Handle POST /price with a JSON or msgpack body"""
+        if self.path != '/price':
+            self._send_error(404, f"Unknown path {self.path}")
+            return
+
+        use_msgpack = self.headers.get('Content-Type', '').startswith(MSGPACK_CONTENT_TYPE)
+        if use_msgpack and msgpack is None:
+            self._send_error(415, "msgpack is not installed on the server")
+            return
+
+        try:
+            body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            payload = msgpack.unpackb(body) if use_msgpack else json.loads(body)
+            columns, is_call = parse_contracts(payload)
+        except (ValueError, KeyError, TypeError) as e:
+            self._send_error(400, f"Invalid request: {e}")
+            return
+
+        results = self.server.batcher.submit(columns, is_call)
+        response = {
+            'results': [
+                {name: finite_or_none(values[i]) for name, values in results.items()}
+                for i in range(len(is_call))
+            ]
+        }
+        self._send(200, response, use_msgpack)
+
+    def do_GET(self):
+        """Handle GET /stats with batching counters"""
+        if self.path != '/stats':
+            self._send_error(404, f"Unknown path {self.path}")
+            return
+        batcher = self.server.batcher
+        self._send(200, {
+            'batches': batcher.batches,
+            'contracts': batcher.contracts,
+            'window': batcher.window,
+            'max_batch': batcher.max_batch
+        })
+
+    def _send(self, status, payload, use_msgpack=False):
+        if use_msgpack:
+            body = msgpack.packb(payload)
+            content_type = MSGPACK_CONTENT_TYPE
+        else:
+            body = json.dumps(payload, allow_nan=False).encode()
+            content_type = 'application/json'
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status, message):
+        self._send(status, {'error': message})
+
+    def log_message(self, format, *args):
+        pass  # per-request logging would dominate the cost of a pricing call
+
+class PricingServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, host='127.0.0.1', port=8600, window=0.002, max_batch=100_000):
+        super().__init__((host, port), PricingRequestHandler)
+        self.batcher = MicroBatcher(window, max_batch)
+
+    def serve(self):
+        """Serve until interrupted"""
+        host, port = self.server_address[:2]
+        print(f"Pricing server listening on http://{host}:{port} "
+              f"(batch window {self.batcher.window * 1000:.1f} ms)")
+        try:
+            self.serve_forever()
+        except KeyboardInterrupt:
+            print("Stopping pricing server")
+        finally:
+            self.server_close()
+            self.batcher.stop()
@@ -0,0 +1,52 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('scipy')
+
+from core.backend_benchmark import ACCURACY_BOUNDS, OUTPUTS, check_accuracy, check_reference, evaluate
+from core.backends import create_backend
+
+@pytest.fixture(params=list(ACCURACY_BOUNDS))
+def backend(request):
+    if request.param.startswith('numba'):
+        pytest.importorskip('numba')
+    return create_backend(request.param)
+
+def test_numpy_backend_matches_scalar_formulas():
+    for output, error in check_reference().items():
+        assert error < 1e-10, output
+
+def test_backend_within_accuracy_bounds(backend):
+    report = check_accuracy(n=200_000, names=[backend.name])[backend.name]
+
+    for output, (error, within) in report.items():
+        assert within, f"{backend.name} {output} error {error:.2e} exceeds {ACCURACY_BOUNDS[backend.name]}"
+
+def test_expired_contracts_use_intrinsic_value(backend):
+    S = np.array([110.0, 90.0, 110.0, 90.0, 100.0])
+    K = np.full(5, 100.0)
+    is_call = np.array([True, True, False, False, True])
+    results = evaluate(backend, (S, K, np.array([0.0, -0.01, 0.0, 0.0, 0.0]), 0.05, 0.2, is_call))
+
+    np.testing.assert_allclose(results['price'], [10.0, 0.0, 0.0, 10.0, 0.0])
+    np.testing.assert_allclose(results['delta'], [1.0, 0.0, 0.0, -1.0, 0.0])
+    for output in ['gamma', 'theta', 'vega', 'rho']:
+        np.testing.assert_allclose(results[output], 0.0)
+
+def test_zero_volatility_prices_the_discounted_forward(backend):
+    S = np.full(5, 100.0)
+    K = np.array([90.0, 110.0, 90.0, 110.0, 100.0])
+    T, r = 0.5, np.array([0.05, 0.05, 0.05, 0.05, 0.0])
+    is_call = np.array([True, True, False, False, True])
+    results = evaluate(backend, (S, K, T, r, 0.0, is_call))
+
+    discounted_K = K * np.exp(-r * T)
+    expected = np.where(is_call, np.maximum(S - discounted_K, 0), np.maximum(discounted_K - S, 0))
+    tolerance = ACCURACY_BOUNDS['float32']
+    for output in OUTPUTS:
+        assert np.all(np.isfinite(results[output])), output
+        assert results[output].dtype == backend.dtype, output
+    np.testing.assert_allclose(results['price'], expected, **tolerance)
+    np.testing.assert_allclose(results['delta'], [1.0, 0.0, 0.0, -1.0, 0.0])
+    np.testing.assert_allclose(results['gamma'], 0.0)
+    np.testing.assert_allclose(results['vega'], 0.0)
@@ -0,0 +1,106 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+import pytest
+
+pd = pytest.importorskip('pandas')
+pq = pytest.importorskip('pyarrow.parquet')
+
+from core.batch_pricer import BatchPricer, expiry_year_fractions, price_contracts
+
+def test_mixed_dtype_chunks_share_one_schema(tmp_path):
+    # First chunk has only whole-number spots/strikes, the second has decimals
+    rows = [(100, 100, 0.5, 0.05, 0.2, 'call')] * 5 + [(100.5, 102.5, 0.5, 0.05, 0.2, 'put')] * 5
+    input_path = tmp_path / 'contracts.csv'
+    pd.DataFrame(rows, columns=['S', 'K', 'T', 'r', 'sigma', 'type']).to_csv(input_path, index=False)
+    output_path = tmp_path / 'priced.parquet'
+
+    rows_written = BatchPricer(chunk_size=5, workers=1).run(str(input_path), str(output_path))
+
+    result = pq.read_table(output_path).to_pandas()
+    assert rows_written == 10
+    assert len(result) == 10
+    assert result['K'].dtype == 'float64'
+    assert result['K'].iloc[-1] == 102.5
+    assert result['price'].notna().all()
+
+def test_failed_run_keeps_existing_output(tmp_path):
+    output_path = tmp_path / 'priced.parquet'
+    output_path.write_bytes(b'previous results')
+
+    with pytest.raises(FileNotFoundError):
+        BatchPricer(workers=1).run(str(tmp_path / 'missing.csv'), str(output_path))
+
+    assert output_path.read_bytes() == b'previous results'
+    assert not (tmp_path / 'priced.parquet.tmp').exists()
+
+def test_failed_chunk_keeps_existing_output(tmp_path):
+    rows = [(100, 100, 0.5, 0.05, 0.2, 'call')] * 5 + [('bad', 100, 0.5, 0.05, 0.2, 'put')]
+    input_path = tmp_path / 'contracts.csv'
+    pd.DataFrame(rows, columns=['S', 'K', 'T', 'r', 'sigma', 'type']).to_csv(input_path, index=False)
+    output_path = tmp_path / 'priced.parquet'
+    output_path.write_bytes(b'previous results')
+
+    with pytest.raises(ValueError):
+        BatchPricer(chunk_size=5, workers=1).run(str(input_path), str(output_path))
+
+    assert output_path.read_bytes() == b'previous results'
+    assert not (tmp_path / 'priced.parquet.tmp').exists()
+
+EXPIRIES = ['2026-11-20', '2026-11-20 00:00', '2026-11-20 10:00', '2026-11-20 16:00', '2026-11-20T16:00:00']
+
+def test_expiry_rules_do_not_depend_on_chunking(tmp_path):
+    input_path = tmp_path / 'contracts.csv'
+    pd.DataFrame({
+        'S': 100.0, 'K': 100.0, 'expiry': EXPIRIES, 'r': 0.05, 'sigma': 0.2, 'type': 'call'
+    }).to_csv(input_path, index=False)
+    valuation_time = datetime(2026, 10, 19, 12, tzinfo=ZoneInfo('America/New_York'))
+
+    results = []
+    for chunk_size in (1, len(EXPIRIES)):
+        output_path = tmp_path / f'priced_{chunk_size}.parquet'
+        BatchPricer(chunk_size=chunk_size, workers=1, valuation_time=valuation_time).run(
+            str(input_path), str(output_path))
+        results.append(pq.read_table(output_path).to_pandas()['T'].to_numpy())
+
+    for T in results[1:]:
+        assert (T == results[0]).all()
+    T = results[0]
+    assert T[0] == T[3] == T[4]  # a bare date expires at the 16:00 close
+    assert T[1] < T[2] < T[3]  # an explicit midnight stays midnight
+
+def test_expiry_year_fractions_parses_mixed_iso_formats():
+    valuation_time = datetime(2026, 10, 19, 12, tzinfo=ZoneInfo('America/New_York'))
+
+    T = expiry_year_fractions(pd.Series(EXPIRIES, dtype='string'), valuation_time)
+    single = [expiry_year_fractions(pd.Series([expiry], dtype='string'), valuation_time)[0] for expiry in EXPIRIES]
+
+    assert list(T) == single
+
+def test_missing_expiry_raises_with_row():
+    with pytest.raises(ValueError, match=r'\[1\]'):
+        expiry_year_fractions(pd.Series(['2026-11-20', None], dtype='string'))
+
+def test_timezone_aware_expiries_are_converted():
+    valuation_time = datetime(2026, 10, 19, 12, tzinfo=ZoneInfo('America/New_York'))
+
+    aware = expiry_year_fractions(pd.Series(['2026-11-20T21:00:00Z'], dtype='string'), valuation_time)
+    local = expiry_year_fractions(pd.Series(['2026-11-20 16:00'], dtype='string'), valuation_time)
+
+    assert aware[0] == local[0]
+
+def test_numba_backend_after_numba_ran_in_parent(tmp_path):
+    pytest.importorskip('numba')
+    from core.backends import create_backend
+
+    # Starts Numba's worker threads here; forked pool workers would deadlock
+    create_backend('numba').prices(100.0, 100.0, 0.5, 0.05, 0.2, True)
+    rows = [(100, 90 + i, 0.5, 0.05, 0.2, 'call' if i % 2 else 'put') for i in range(10)]
+    contracts = pd.DataFrame(rows, columns=['S', 'K', 'T', 'r', 'sigma', 'type'])
+    input_path = tmp_path / 'contracts.csv'
+    contracts.to_csv(input_path, index=False)
+    output_path = tmp_path / 'priced.parquet'
+
+    BatchPricer(chunk_size=5, workers=1, backend='numba').run(str(input_path), str(output_path))
+
+    expected = price_contracts(contracts, backend='numpy')['price']
+    assert (abs(pq.read_table(output_path).to_pandas()['price'] - expected) < 1e-9).all()
@@ -0,0 +1,81 @@
+import http.client
+import json
+import random
+import threading
+import pytest
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('scipy')
+
+from core.black_scholes import BlackScholes
+from service.load_generator import make_contracts
+from service.pricing_server import CONTRACT_FIELDS, PricingServer
+
+@pytest.fixture
+def server():
+    server = PricingServer(port=0, window=0.05)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    server.batcher.stop()
+
+def post(server, payload):
+    connection = http.client.HTTPConnection(*server.server_address[:2])
+    try:
+        connection.request('POST', '/price', json.dumps(payload), {'Content-Type': 'application/json'})
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+def get_stats(server):
+    connection = http.client.HTTPConnection(*server.server_address[:2])
+    try:
+        connection.request('GET', '/stats')
+        return json.loads(connection.getresponse().read())
+    finally:
+        connection.close()
+
+def test_concurrent_requests_are_batched_and_split_in_order(server):
+    clients = 8
+    rng = random.Random(0)
+    requests = [make_contracts(i + 1, rng) for i in range(clients)]
+    responses = [None] * clients
+    barrier = threading.Barrier(clients)
+
+    def client(i):
+        barrier.wait()
+        responses[i] = post(server, {'contracts': requests[i]})
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for contracts, (status, body) in zip(requests, responses):
+        assert status == 200
+        columns = [np.array([contract[field] for contract in contracts]) for field in CONTRACT_FIELDS]
+        is_call = np.array([contract['type'] == 'call' for contract in contracts])
+        expected = BlackScholes.calculate_prices(*columns, is_call)
+        assert len(body['results']) == len(contracts)
+        np.testing.assert_allclose([result['price'] for result in body['results']], expected, rtol=1e-12)
+
+    stats = get_stats(server)
+    assert stats['contracts'] == sum(len(contracts) for contracts in requests)
+    assert stats['batches'] < clients
+
+@pytest.mark.parametrize('payload', [
+    {'S': 0, 'K': 100, 'T': 0.5, 'r': 0.05, 'sigma': 0.2},
+    {'S': 100, 'K': 100, 'T': 0.5, 'r': 0.05, 'sigma': -0.2},
+    {'S': 100, 'K': 100, 'T': 0.5, 'r': 0.05},
+    {'contracts': [{'S': 'abc', 'K': 100, 'T': 0.5, 'r': 0.05, 'sigma': 0.2}]},
+])
+def test_invalid_contracts_are_rejected(server, payload):
+    status, body = post(server, payload)
+    assert status == 400
+    assert 'error' in body
+    assert get_stats(server)['contracts'] == 0
@@ -0,0 +1,109 @@
+import time
+import pytest
+
+pytest.importorskip('numpy')
+
+from data.request_scheduler import RequestScheduler, is_rate_limit_error
+from data.stub_price_server import StubAPIError, StubPriceClient, StubPriceServer
+
+PRICES = {'AAPL': 190.5, 'MSFT': 410.25, 'NVDA': 120.0, 'SPY': 560.75, 'QQQ': 480.1}
+
+@pytest.fixture
+def server():
+    server = StubPriceServer(PRICES).start()
+    yield server
+    server.stop()
+
+@pytest.fixture
+def scheduler(server):
+    scheduler = RequestScheduler(StubPriceClient(server.url).get_current_prices,
+                                 requests_per_minute=6000, batch_window=0.1)
+    yield scheduler
+    scheduler.stop()
+
+def test_concurrent_requests_merge_into_one_call(server, scheduler):
+    futures = {symbol: scheduler.request(symbol) for symbol in PRICES}
+
+    assert {symbol: future.result(timeout=5) for symbol, future in futures.items()} == PRICES
+    assert len(server.calls) == 1
+    assert sorted(server.calls[0]) == sorted(PRICES)
+    assert scheduler.stats()['avg_batch_size'] == len(PRICES)
+
+def test_rate_limit_response_backs_off(server, scheduler):
+    server.rate_limit_next = 1
+
+    with pytest.raises(StubAPIError):
+        scheduler.request('AAPL').result(timeout=5)
+    assert scheduler.stats()['rate_limited'] == 1
+    assert scheduler.bucket.wait_time() > 0.5
+
+    start = time.monotonic()
+    assert scheduler.request('AAPL').result(timeout=5) == PRICES['AAPL']
+    assert time.monotonic() - start > 0.5
+    assert len(server.calls) == 2
+
+def test_rate_limit_detection_ignores_unrelated_429_text():
+    assert is_rate_limit_error(StubAPIError(429, 'Too many requests'))
+    assert is_rate_limit_error(RuntimeError('Rate limit exceeded'))
+    assert not is_rate_limit_error(RuntimeError('Order 4291 rejected'))
+    assert not is_rate_limit_error(StubAPIError(500, 'Symbol XYZ429 not found'))
+
+def test_watched_symbol_jumps_a_longer_unwatched_queue(server):
+    scheduler = RequestScheduler(StubPriceClient(server.url).get_current_prices,
+                                 requests_per_minute=6000, max_batch_size=2, batch_window=0.0)
+    try:
+        # Hold the worker while the queue builds up
+        scheduler.bucket.penalize(0.3)
+        unwatched = ['AAPL', 'MSFT', 'NVDA', 'SPY']
+        background = [scheduler.request(symbol) for symbol in unwatched]
+        scheduler.watch('QQQ')
+        watched = scheduler.request('QQQ')
+
+        assert watched.result(timeout=5) == PRICES['QQQ']
+        assert 'QQQ' in server.calls[0]
+        assert [future.result(timeout=5) for future in background] == [PRICES[s] for s in ['AAPL', 'MSFT', 'NVDA', 'SPY']]
+        assert len(server.calls) == 3
+    finally:
+        scheduler.stop()
+
+def test_hub_watches_symbols_per_subscription(scheduler):
+    from data.market_data_hub import MarketDataHub
+
+    class IdleStreamer:
+        def __init__(self, data_source, update_interval, scheduler=None):
+            pass
+
+        def start_streaming(self, symbols):
+            pass
+
+        def stop_streaming(self):
+            pass
+
+    hub = MarketDataHub(streamer_factory=IdleStreamer)
+    hub.schedulers['binance'] = scheduler
+    first = hub.subscribe('binance', 'AAPL')
+    second = hub.subscribe('binance', 'AAPL')
+    assert scheduler.stats()['watched'] == 1 and scheduler.watched['AAPL'] == 2
+
+    first.close()
+    assert scheduler.watched['AAPL'] == 1
+    second.close()
+    assert 'AAPL' not in scheduler.watched
+
+def test_stop_streaming_does_not_wait_out_a_backoff(server, scheduler):
+    from data.data_streamer import DataStreamer
+
+    server.rate_limit_next = 1
+    scheduler.backoff = 8.0
+    streamer = DataStreamer('binance', update_interval=0.05, scheduler=scheduler)
+    streamer.start_streaming(['AAPL'])
+    deadline = time.monotonic() + 5
+    while scheduler.stats()['rate_limited'] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert scheduler.bucket.wait_time() > 5
+    time.sleep(0.2)  # the next poll is now stuck behind the backoff
+
+    start = time.monotonic()
+    streamer.stop_streaming()
+    assert time.monotonic() - start < 1.0
+    assert not streamer.stream_thread.is_alive()
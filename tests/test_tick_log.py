@@ -0,0 +1,99 @@
+import os
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from data.replay_data import ReplayData
+from data.tick_log import HEADER_SIZE, RECORD_DTYPE, TickLogReader, TickLogWriter, index_path
+
+START_NS = 1_760_000_000 * 10**9
+TICKS = [
+    ('AAPL', 190.0, START_NS),
+    ('MSFT', 410.0, START_NS + 500_000_000),
+    ('AAPL', 190.5, START_NS + 1_000_000_000),
+    ('BTCUSDT', 65000.0, START_NS + 1_500_000_000),
+    ('AAPL', 191.0, START_NS + 2_000_000_000),
+]
+
+def write_log(path, ticks=TICKS):
+    writer = TickLogWriter(str(path))
+    for symbol, price, timestamp in ticks:
+        writer.append(symbol, price, timestamp)
+    writer.close()
+    return str(path)
+
+def test_round_trip_and_symbol_index(tmp_path):
+    path = write_log(tmp_path / 'session.ticks')
+
+    assert os.path.getsize(path) == HEADER_SIZE + len(TICKS) * RECORD_DTYPE.itemsize
+    assert os.path.exists(index_path(path))
+
+    reader = TickLogReader(path)
+    assert len(reader) == len(TICKS)
+    assert reader.symbols == ['AAPL', 'MSFT', 'BTCUSDT']
+    assert list(reader.records['timestamp_ns']) == [tick[2] for tick in TICKS]
+    assert list(reader.symbol_records('AAPL')['price']) == [190.0, 190.5, 191.0]
+    assert len(reader.symbol_records('ETHUSDT')) == 0
+
+def test_select_keeps_log_order_without_copying(tmp_path):
+    reader = TickLogReader(write_log(tmp_path / 'session.ticks'))
+
+    everything = reader.select()
+    assert isinstance(everything, np.memmap)
+    assert np.shares_memory(everything, reader.records)
+
+    subset = reader.select(['BTCUSDT', 'MSFT'])
+    assert list(subset['price']) == [410.0, 65000.0]
+
+def test_torn_record_is_truncated_on_reopen(tmp_path):
+    path = write_log(tmp_path / 'session.ticks')
+    with open(path, 'ab') as f:
+        f.write(b'\x01' * 10)  # crash mid-record
+
+    writer = TickLogWriter(path)
+    writer.append('MSFT', 411.0, START_NS + 3_000_000_000)
+    writer.close()
+
+    reader = TickLogReader(path)
+    assert len(reader) == len(TICKS) + 1
+    assert reader.records['price'][-1] == 411.0
+    assert list(reader.symbol_records('MSFT')['price']) == [410.0, 411.0]
+
+def test_stale_index_is_rebuilt(tmp_path):
+    path = write_log(tmp_path / 'session.ticks')
+
+    # Append without closing, so the saved index no longer matches the log
+    writer = TickLogWriter(path)
+    writer.append('AAPL', 192.0, START_NS + 3_000_000_000)
+    writer.flush()
+
+    reader = TickLogReader(path)
+    assert list(reader.symbol_records('AAPL')['price']) == [190.0, 190.5, 191.0, 192.0]
+    writer.close()
+
+def test_replay_as_fast_as_possible(tmp_path):
+    replay = ReplayData(write_log(tmp_path / 'session.ticks'), speed=None)
+
+    ticks = list(replay.iter_ticks(wait=pytest.fail))
+
+    assert [(symbol, price) for symbol, price, _ in ticks] == [(symbol, price) for symbol, price, _ in TICKS]
+    assert replay.get_current_price('AAPL') == 191.0
+
+def test_replay_speed_scales_recorded_gaps(tmp_path):
+    replay = ReplayData(write_log(tmp_path / 'session.ticks'), speed=10)
+    delays = []
+
+    ticks = list(replay.iter_ticks(['AAPL'], wait=delays.append))
+
+    # Without real sleeping every delay is the tick's offset from the start
+    assert len(ticks) == 3
+    assert delays == pytest.approx([0.1, 0.2], abs=0.05)
+
+def test_replay_stops_when_should_continue_is_false(tmp_path):
+    replay = ReplayData(write_log(tmp_path / 'session.ticks'), speed=None)
+    seen = []
+
+    for tick in replay.iter_ticks(should_continue=lambda: len(seen) < 2):
+        seen.append(tick)
+
+    assert len(seen) == 2
@@ -1,4 +1,5 @@
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, timedelta, timezone
+from utils.trading_calendar import get_default_calendar
 
 def calculate_time_to_expiry(expiry_date, current_date=None):
     """Calculate time to expiry in years"""
@@ -12,15 +13,21 @@ def calculate_time_to_expiry(expiry_date, current_date=None):
     time_delta = expiry_date - current_date
     return max(time_delta.total_seconds() / (365.25 * 24 * 3600), 0)  # Ensure non-negative
 
+def calculate_times_to_expiry(expiry_dates, current_date=None, trading_time=False):
+    """Calculate time to expiry in years for an array of expiries.
+
+    All expiries are measured against one snapshot time. With trading_time
+    the fraction counts exchange trading hours instead of calendar time.
+    """
+    calendar = get_default_calendar()
+    if trading_time:
+        return calendar.trading_year_fraction(expiry_dates, current_date)
+    return calendar.year_fraction(expiry_dates, current_date)
+
 def get_weekly_expiry(days=7):
     """Get expiry date 7 days from now"""
     return datetime.now() + timedelta(days=days)
 
 def is_market_open():
-    """Check if market is currently open (basic implementation)"""
-    now = datetime.now()
-    # US Market hours (9:30 AM - 4:00 PM EST)
-    market_open = now.replace(hour=19, minute=00, second=0, microsecond=0)
-    market_close = now.replace(hour=3, minute=00, second=0, microsecond=0)
-    
-    return market_open <= now <= market_close and now.weekday() < 5
\ No newline at end of file
+    """Check if the US equity market is currently in session"""
+    return get_default_calendar().is_open(datetime.now(timezone.utc))
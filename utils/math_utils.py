@@ -1,4 +1,5 @@
 import numpy as np
+from scipy.special import ndtr
 from scipy.stats import norm
 
 def calculate_d1_d2(S, K, T, r, sigma):
@@ -10,6 +11,39 @@ def calculate_d1_d2(S, K, T, r, sigma):
     d2 = d1 - sigma * np.sqrt(T)
     return d1, d2
 
+def calculate_d1_d2_vectorized(S, K, T, r, sigma, dtype=np.float64):
+    """Calculate d1 and d2 element-wise for arrays of contracts.
+
+    Expired contracts (T <= 0) get d1 = d2 = 0, matching calculate_d1_d2.
+    With zero volatility d1 = d2 = +/-inf depending on whether the spot is
+    above the discounted strike. Inputs are cast to `dtype` and the results
+    keep that precision.
+    """
+    S, K, T, r, sigma = np.broadcast_arrays(
+        *(np.asarray(x, dtype=dtype) for x in (S, K, T, r, sigma))
+    )
+    live = T > 0
+    vol_sqrt_T = sigma * np.sqrt(np.where(live, T, 0.0))
+    drift = np.log(S / K) + (r + 0.5 * sigma ** 2) * T
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        d1 = drift / vol_sqrt_T
+    
+    inf = d1.dtype.type(np.inf)
+    d1 = np.where(vol_sqrt_T > 0, d1, np.where(drift > 0, inf, -inf))
+    d1 = np.where(live, d1, 0.0)
+    d2 = np.where(live, d1 - vol_sqrt_T, 0.0)
+    return d1, d2
+
 def normal_cdf(x):
     """Standard normal cumulative distribution function"""
-    return norm.cdf(x)
\ No newline at end of file
+    return norm.cdf(x)
+
+def normal_cdf_fast(x):
+    """Standard normal CDF that keeps the input dtype (float32 stays float32)"""
+    return ndtr(x)
+
+def normal_pdf_fast(x):
+    """Standard normal PDF that keeps the input dtype (float32 stays float32)"""
+    x = np.asarray(x)
+    return np.exp(-0.5 * x * x) * x.dtype.type(1 / np.sqrt(2 * np.pi))
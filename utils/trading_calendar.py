@@ -0,0 +1,238 @@
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+import numpy as np
+
+NS_PER_SECOND = 1_000_000_000
+NS_PER_DAY = 86_400 * NS_PER_SECOND
+SECONDS_PER_YEAR = 365.25 * 24 * 3600
+TRADING_DAYS_PER_YEAR = 252
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+def _nth_weekday(year, month, weekday, n):
+    """n-th given weekday (Mon=0) of a month"""
+    first = date(year, month, 1)
+    return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+
+def _last_weekday(year, month, weekday):
+    """Last given weekday (Mon=0) of a month"""
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+def _easter(year):
+    """Gregorian Easter Sunday (anonymous algorithm)"""
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = b // 4, b % 4
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = c // 4, c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 19 * l) // 433
+    month = (h + l - 7 * m + 90) // 25
+    return date(year, month, (h + l - 7 * m + 33 * month + 19) % 32)
+
+def _observed(day):
+    """Move a Saturday holiday to Friday and a Sunday holiday to Monday"""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+def nyse_holidays(year):
+    """NYSE full-day holidays for a year (regular rules, no special closures)"""
+    holidays = []
+    new_year = date(year, 1, 1)
+    if new_year.weekday() == 6:
+        holidays.append(new_year + timedelta(days=1))
+    elif new_year.weekday() < 5:
+        holidays.append(new_year)  # a Saturday New Year is not observed
+    if year >= 1998:
+        holidays.append(_nth_weekday(year, 1, 0, 3))  # Martin Luther King Jr. Day
+    holidays.append(_nth_weekday(year, 2, 0, 3))  # Washington's Birthday
+    holidays.append(_easter(year) - timedelta(days=2))  # Good Friday
+    holidays.append(_last_weekday(year, 5, 0))  # Memorial Day
+    if year >= 2022:
+        holidays.append(_observed(date(year, 6, 19)))  # Juneteenth
+    holidays.append(_observed(date(year, 7, 4)))  # Independence Day
+    holidays.append(_nth_weekday(year, 9, 0, 1))  # Labor Day
+    holidays.append(_nth_weekday(year, 11, 3, 4))  # Thanksgiving
+    holidays.append(_observed(date(year, 12, 25)))  # Christmas
+    return holidays
+
+def nyse_early_closes(year):
+    """NYSE 1pm early-close days for a year"""
+    early_closes = [_nth_weekday(year, 11, 3, 4) + timedelta(days=1)]  # day after Thanksgiving
+    july_3 = date(year, 7, 3)
+    if july_3.weekday() < 4:
+        early_closes.append(july_3)
+    christmas_eve = date(year, 12, 24)
+    if christmas_eve.weekday() < 5:
+        early_closes.append(christmas_eve)
+    return early_closes
+
+class TradingCalendar:
+    """Precomputed exchange session table for vectorized time queries.
+
+    Every session between start_year and end_year is stored as sorted UTC
+    nanosecond open/close arrays together with the cumulative trading time
+    before it, so year fractions for whole arrays of expiries are a couple of
+    `np.searchsorted` calls against one snapshot time, and market-open and
+    next-session queries are O(log n).
+
+    Naive datetimes (Python, pandas or datetime64) are taken as
+    exchange-local time, timezone-aware values are converted, and plain
+    dates (and datetime64[D]) mean the regular close on that date. Missing
+    values and times outside the calendar range raise ValueError.
+    """
+
+    def __init__(self, start_year=2000, end_year=2050, timezone_name='America/New_York',
+                 open_time=time(9, 30), close_time=time(16, 0), early_close_time=time(13, 0),
+                 holidays=None, early_closes=None):
+        self.tz = ZoneInfo(timezone_name)
+        years = range(start_year, end_year + 1)
+        if holidays is None:
+            holidays = [day for year in years for day in nyse_holidays(year)]
+        if early_closes is None:
+            early_closes = [day for year in years for day in nyse_early_closes(year)]
+
+        days = np.arange(np.datetime64(f'{start_year}-01-01'), np.datetime64(f'{end_year + 1}-01-01'))
+        self.first_day = days[0]
+        self.last_day = days[-1]
+
+        # UTC offset per calendar day, sampled at noon (DST switches overnight)
+        offsets_ns = np.array([
+            datetime.combine(day, time(12), self.tz).utcoffset() // timedelta(microseconds=1)
+            for day in days.astype(date)
+        ], dtype=np.int64) * 1000
+        day_start_ns = days.astype('datetime64[ns]').astype(np.int64) - offsets_ns
+        self.day_offset_ns = offsets_ns
+        self.range_start_ns = int(day_start_ns[0])
+        self.range_end_ns = int(day_start_ns[-1]) + NS_PER_DAY
+
+        def at(clock):
+            return day_start_ns + (clock.hour * 3600 + clock.minute * 60 + clock.second) * NS_PER_SECOND
+
+        self.day_close_ns = at(close_time)
+
+        weekday = (days.astype(np.int64) + 3) % 7  # 1970-01-01 was a Thursday
+        holiday_days = np.array(holidays, dtype='datetime64[D]')
+        early_days = np.array(early_closes, dtype='datetime64[D]')
+        is_session = (weekday < 5) & ~np.isin(days, holiday_days)
+        closes = np.where(np.isin(days, early_days), at(early_close_time), at(close_time))
+
+        self.session_open_ns = at(open_time)[is_session]
+        self.session_close_ns = closes[is_session]
+        session_seconds = (self.session_close_ns - self.session_open_ns) / NS_PER_SECOND
+        self.cumulative_seconds = np.concatenate([[0.0], np.cumsum(session_seconds)[:-1]])
+        self.full_session_seconds = (at(close_time)[0] - at(open_time)[0]) / NS_PER_SECOND
+
+    def _scalar_to_ns(self, value):
+        if value is None or value != value:  # None, NaN or NaT
+            raise ValueError("Missing expiry/valuation time")
+        if isinstance(value, datetime):
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=self.tz)
+            return (value - EPOCH) // timedelta(microseconds=1) * 1000
+        if isinstance(value, date):
+            return int(self._dates_to_close_ns(np.datetime64(value, 'D')))
+        return int(self.to_ns(np.datetime64(value)))
+
+    def _dates_to_close_ns(self, days):
+        offsets = (days - self.first_day).astype(np.int64)
+        if np.any(offsets < 0) or np.any(offsets >= len(self.day_close_ns)):
+            raise ValueError(f"Date outside calendar range {self.first_day} to {self.last_day}")
+        return self.day_close_ns[offsets]
+
+    def _check_range(self, ns):
+        if np.any(ns < self.range_start_ns) or np.any(ns >= self.range_end_ns):
+            raise ValueError(f"Time outside calendar range {self.first_day} to {self.last_day}")
+        return ns
+
+    def _local_to_ns(self, local):
+        """Localize naive exchange-time datetime64 values to UTC ns"""
+        if np.any(np.isnat(local)):
+            raise ValueError("Missing expiry/valuation time")
+        local_ns = local.astype('datetime64[ns]').astype(np.int64)
+        days = local_ns // NS_PER_DAY - self.first_day.astype(np.int64)
+        if np.any(days < 0) or np.any(days >= len(self.day_offset_ns)):
+            raise ValueError(f"Time outside calendar range {self.first_day} to {self.last_day}")
+        return local_ns - self.day_offset_ns[days]
+
+    def to_ns(self, values):
+        """Convert datetimes or dates (scalar or array) to UTC ns since epoch"""
+        # Timezone-aware pandas Series/DatetimeIndex: convert to UTC directly
+        accessor = getattr(values, 'dt', values)
+        if hasattr(values, 'isna') and getattr(accessor, 'tz', None) is not None:
+            if np.any(values.isna()):
+                raise ValueError("Missing expiry/valuation time")
+            utc = accessor.tz_convert('UTC')
+            utc = np.asarray(getattr(utc, 'dt', utc).tz_localize(None), dtype='datetime64[ns]')
+            return self._check_range(utc.astype(np.int64))
+
+        values = np.asarray(values)
+        if values.dtype == np.dtype('datetime64[D]'):
+            if np.any(np.isnat(values)):
+                raise ValueError("Missing expiry/valuation time")
+            return self._dates_to_close_ns(values)
+        if np.issubdtype(values.dtype, np.datetime64):
+            return self._local_to_ns(values)
+
+        # Python objects: convert each distinct value once
+        converted = {}
+        result = np.empty(values.size, dtype=np.int64)
+        for i, value in enumerate(values.flat):
+            ns = converted.get(value)
+            if ns is None:
+                ns = converted[value] = self._scalar_to_ns(value)
+            result[i] = ns
+        return self._check_range(result.reshape(values.shape))
+
+    def _snapshot_ns(self, now):
+        return self.to_ns(datetime.now(timezone.utc) if now is None else now)
+
+    def trading_seconds_before(self, ns):
+        """Cumulative trading seconds from the first session up to each time"""
+        ns = np.asarray(ns, dtype=np.int64)
+        index = np.searchsorted(self.session_open_ns, ns, side='right') - 1
+        safe = np.clip(index, 0, None)
+        within = np.clip(ns - self.session_open_ns[safe], 0,
+                         self.session_close_ns[safe] - self.session_open_ns[safe])
+        return np.where(index >= 0, self.cumulative_seconds[safe] + within / NS_PER_SECOND, 0.0)
+
+    def year_fraction(self, expiries, now=None):
+        """Calendar time to expiry in years (365.25-day year), floored at zero"""
+        delta_ns = self.to_ns(expiries) - self._snapshot_ns(now)
+        return np.maximum(delta_ns / NS_PER_SECOND / SECONDS_PER_YEAR, 0.0)
+
+    def trading_year_fraction(self, expiries, now=None):
+        """Trading time to expiry in years of 252 full sessions, floored at zero"""
+        elapsed = (self.trading_seconds_before(self.to_ns(expiries))
+                   - self.trading_seconds_before(self._snapshot_ns(now)))
+        return np.maximum(elapsed / (TRADING_DAYS_PER_YEAR * self.full_session_seconds), 0.0)
+
+    def is_open(self, when=None):
+        """Whether the market is in session at the given time(s)"""
+        ns = self._snapshot_ns(when)
+        index = np.searchsorted(self.session_open_ns, ns, side='right') - 1
+        safe = np.clip(index, 0, None)
+        result = (index >= 0) & (ns < self.session_close_ns[safe])
+        return bool(result) if np.ndim(result) == 0 else result
+
+    def next_session(self, when=None):
+        """(open, close) of the first session opening after the given time"""
+        index = int(np.searchsorted(self.session_open_ns, self._snapshot_ns(when), side='right'))
+        if index >= len(self.session_open_ns):
+            return None
+        return (
+            self._from_ns(self.session_open_ns[index]),
+            self._from_ns(self.session_close_ns[index])
+        )
+
+    def _from_ns(self, ns):
+        return (EPOCH + timedelta(microseconds=int(ns) // 1000)).astimezone(self.tz)
+
+@lru_cache(maxsize=None)
+def get_default_calendar():
+    """Shared NYSE calendar instance"""
+    return TradingCalendar()